@@ -46,6 +46,7 @@ from telegram.ext import MessageHandler, filters
 import anthropic
 from datetime import datetime, timedelta
 import json
+import re
 import pytz
 
 # Load environment variables
@@ -123,6 +124,10 @@ editing_task = {}
 # AI client for task parsing
 ai_client = None
 
+# AI parses by (text, today, timezone) → result; today in the key retires entries daily
+_task_parse_cache = {}
+TASK_PARSE_CACHE_SIZE = 256
+
 
 def get_main_keyboard() -> ReplyKeyboardMarkup:
     """Persistent reply keyboard with the two most-used actions."""
@@ -161,16 +166,65 @@ def init_ai_client():
     """Initialize Anthropic client for AI task parsing."""
     global ai_client
     if ANTHROPIC_API_KEY:
-        ai_client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+        # Async client so a multi-second parse doesn't stall other updates
+        ai_client = anthropic.AsyncAnthropic(api_key=ANTHROPIC_API_KEY)
         logger.info("AI task parser initialized (Haiku)")
     else:
         logger.warning("ANTHROPIC_API_KEY not set - using regex parser fallback")
 
 
-def parse_task_with_ai(text: str, timezone: str = "Europe/London") -> dict:
+# Time ranges ("3点到5点", "4 to 5pm") leave fragments in TaskParser's task text
+_TIME_RANGE_RE = re.compile(r"到|至|~|-|–|\bto\b|\buntil\b|\btill\b", re.IGNORECASE)
+
+
+# An hour TaskParser reads unambiguously: 下午3点 / 晚上八点, or 3pm / 7:30 am.
+# A bare "3点" or "3:30" could be either half of the day, so the AI decides those
+_MARKED_HOUR_RE = re.compile(
+    r"(?:上午|下午|晚上|早上|中午)\s*[\d一二三四五六七八九十两]|\d\s*[ap]m(?![a-z])", re.IGNORECASE
+)
+# Half/quarter hours ("3点半", "3点一刻") that TaskParser leaves out of the time
+_PARTIAL_HOUR_RE = re.compile(r"半|刻")
+# "在"/"于" right before the time, which TaskParser leaves stuck to the task text
+_CN_TIME_CONNECTOR_RE = re.compile(r"[在于]\s*(?:上午|下午|晚上|早上|中午|\d)")
+# Digits or an am/pm marker still in the task text mean part of a time was misread
+# ("7:30pm" is taken as 07:30 by the Chinese pattern, leaving "pm")
+_TIME_LEFTOVER_RE = re.compile(r"\d|(?<![a-z])[ap]m(?![a-z])", re.IGNORECASE)
+# English connectors left dangling where the date/time was cut out ("dinner with Justin at")
+_DANGLING_CONNECTOR_RE = re.compile(r"^(?:at|on|by)\s+|\s+(?:at|on|by)$", re.IGNORECASE)
+
+
+def _regex_parse_is_confident(text: str, parsed: dict) -> bool:
+    """True if TaskParser's result can be used as is.
+
+    Needs a date, an hour with an explicit 上午/下午/am/pm marker, a real
+    category, and nothing TaskParser misreads: time ranges, half/quarter
+    hours, "在" before the time, or time fragments left in the task text.
+    """
+    return bool(
+        parsed.get("date")
+        and parsed.get("start_time")
+        and parsed.get("category") != "Other"
+        and _MARKED_HOUR_RE.search(text)
+        and not _TIME_RANGE_RE.search(text)
+        and not _PARTIAL_HOUR_RE.search(text)
+        and not _CN_TIME_CONNECTOR_RE.search(text)
+        and not _TIME_LEFTOVER_RE.search(parsed.get("task", ""))
+    )
+
+
+def _task_cache_text(text: str) -> str:
+    """Normalize task text for the parse cache: case, spacing and trailing punctuation.
+
+    Only differences that can't change the parse are folded; paraphrases still
+    go to the AI, since a near-match may differ in exactly the time or date.
+    """
+    return " ".join(text.casefold().split()).rstrip(".!?。！？~ ")
+
+
+async def parse_task_with_ai(text: str, timezone: str = "Europe/London") -> dict:
     """Parse task using Claude Haiku for accurate natural language understanding.
 
-    Cost: ~$0.001 per task (very cheap)
+    Cost: ~$0.001 per task (very cheap); free when the regex parser is confident
 
     Args:
         text: Natural language task description
@@ -179,14 +233,24 @@ def parse_task_with_ai(text: str, timezone: str = "Europe/London") -> dict:
     Returns:
         Dictionary with task, date, start_time, end_time, category, priority
     """
+    from habit.task_parser import TaskParser
+    regex_parsed = TaskParser(timezone).parse(text)
     if not ai_client:
         # Fallback to regex parser
-        from habit.task_parser import TaskParser
-        parser = TaskParser(timezone)
-        return parser.parse(text)
+        return regex_parsed
+    # Simple "when + what" inputs the free parser fully understands skip the API
+    if _regex_parse_is_confident(text, regex_parsed):
+        logger.info("Task parsed by regex, skipping AI")
+        task = _DANGLING_CONNECTOR_RE.sub("", regex_parsed["task"]).strip()
+        # TaskParser guesses start + 2h; a single time has no end, as the AI would return
+        return {**regex_parsed, "task": task or regex_parsed["task"], "end_time": None}
 
     today = datetime.now()
     today_str = today.strftime("%Y-%m-%d")
+    cache_key = (_task_cache_text(text), today_str, timezone)
+    cached = _task_parse_cache.get(cache_key)
+    if cached:
+        return dict(cached)
     tomorrow_str = (today + timedelta(days=1)).strftime("%Y-%m-%d")
 
     prompt = f"""Parse this task and extract structured information.
@@ -212,9 +276,11 @@ Examples:
 Return ONLY the JSON object, no other text."""
 
     try:
-        response = ai_client.messages.create(
+        response = await ai_client.messages.create(
             model="claude-haiku-4-5-20251001",
             max_tokens=300,
+            # Deterministic: one input always parses the same way (and is safe to cache)
+            temperature=0,
             messages=[{"role": "user", "content": prompt}]
         )
 
@@ -230,7 +296,7 @@ Return ONLY the JSON object, no other text."""
         parsed = json.loads(result_text)
 
         # Ensure all required fields exist
-        return {
+        result = {
             "task": parsed.get("task", text),
             "date": parsed.get("date"),
             "start_time": parsed.get("start_time"),
@@ -239,13 +305,16 @@ Return ONLY the JSON object, no other text."""
             "priority": parsed.get("priority", "Mid"),
             "success": True
         }
+        if len(_task_parse_cache) >= TASK_PARSE_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _task_parse_cache[next(iter(_task_parse_cache))]
+        _task_parse_cache[cache_key] = result
+        return dict(result)
 
     except Exception as e:
         logger.error(f"AI task parsing failed: {e}, falling back to regex")
         # Fallback to regex parser
-        from habit.task_parser import TaskParser
-        parser = TaskParser(timezone)
-        return parser.parse(text)
+        return regex_parsed
 
 
 def get_category_emoji(category: str) -> str:
@@ -1430,7 +1499,7 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         return
 
     # Otherwise, treat as new task input - use AI parser
-    parsed = parse_task_with_ai(text, TIMEZONE)
+    parsed = await parse_task_with_ai(text, TIMEZONE)
     logger.info(f"AI Parsed task: {parsed}")
 
     # Check for conflicts (tasks at the same time on the same date)
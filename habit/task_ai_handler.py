@@ -6,11 +6,16 @@ Parses natural language task input like "今晚6点和Justin约饭" into structu
 - Task description
 - Priority
 - Category
+
+Not used by habit_bot.py, which parses tasks with its own AsyncAnthropic call
+(see parse_task_with_ai there).
 """
 import anthropic
 import json
 import re
-from datetime import datetime, timedelta
+from datetime import datetime
+
+from habit.task_parser import PRIORITY_EMOJI
 
 
 TASK_SYSTEM_PROMPT = """You parse task input into JSON. Respond with ONLY valid JSON, no other text.
@@ -99,6 +104,8 @@ Parse this into a structured task."""
             message = self.client.messages.create(
                 model="claude-haiku-4-5-20251001",
                 max_tokens=300,
+                # Deterministic: one input always parses the same way (and is safe to cache)
+                temperature=0,
                 system=TASK_SYSTEM_PROMPT,
                 messages=[{"role": "user", "content": prompt}]
             )
@@ -140,7 +147,7 @@ Parse this into a structured task."""
         lines.append(f"• 事项：{parsed.get('task', '')}")
 
         # Priority
-        priority_emoji = {"High": "🔴", "Mid": "🟡", "Low": "🟢"}.get(parsed.get("priority", "Mid"), "🟡")
+        priority_emoji = PRIORITY_EMOJI.get(parsed.get("priority", "Mid"), "🟡")
         lines.append(f"• 优先级：{priority_emoji} {parsed.get('priority', 'Mid')}")
 
         # Category
@@ -8,6 +8,43 @@ import re
 from datetime import datetime, timedelta
 
 
+# Patterns compiled once at import; each is used for both the search and the removal
+_TODAY_RE = re.compile(r'今天|today', re.IGNORECASE)
+_TOMORROW_RE = re.compile(r'明天|明日|tomorrow', re.IGNORECASE)
+_DAY_AFTER_TOMORROW_RE = re.compile(r'后天|後天')
+_SATURDAY_RE = re.compile(r'这?周六|本周六|this saturday|saturday', re.IGNORECASE)
+_SUNDAY_RE = re.compile(r'这?周日|本周日|周天|this sunday|sunday', re.IGNORECASE)
+_NEXT_MONDAY_RE = re.compile(r'下周一|next monday', re.IGNORECASE)
+_TONIGHT_RE = re.compile(r'今晚|tonight', re.IGNORECASE)
+_MONTH_DAY_RE = re.compile(r'(\d{1,2})月(\d{1,2})[日号]?')
+_CN_NUM_TIME_RE = re.compile(r'(上午|下午|晚上|早上|中午)?(十?[一二三四五六七八九十两])[点點時]')
+_CN_TIME_RE = re.compile(r'(上午|下午|晚上|早上|中午)?(\d{1,2})[点點時:：](\d{2})?')
+# "3pm", "3:30 pm" or "15:30"; a bare number ("buy 2 apples", "2025") is not a time.
+# Lookarounds rather than \b, since Chinese characters count as word characters.
+_EN_TIME_RE = re.compile(
+    r'(?<![\d:])(\d{1,2})(?::(\d{2}))?\s*(am|pm)(?![a-z])|(?<![\d:])(\d{1,2}):(\d{2})(?!\d)',
+    re.IGNORECASE,
+)
+_PUNCT_RE = re.compile(r'[，,。.！!？?、]+')
+_SPACES_RE = re.compile(r'\s+')
+_WORK_RE = re.compile(r'开会|会议|工作|meeting|work|office|报告|report')
+_STUDY_RE = re.compile(r'学习|看书|读书|study|learn|课|class|homework')
+_HEALTH_RE = re.compile(r'运动|健身|跑步|gym|exercise|workout|health|医')
+_LIFE_RE = re.compile(r'吃饭|约|朋友|玩|看|show|movie|dinner|lunch|party')
+_HIGH_PRIORITY_RE = re.compile(r'紧急|urgent|重要|important|必须|must|asap')
+_LOW_PRIORITY_RE = re.compile(r'不急|随便|maybe|可能')
+
+# Confirmation-message emoji per priority (unknown priorities show as Mid)
+PRIORITY_EMOJI = {"High": "🔴", "Mid": "🟡", "Low": "🟢"}
+
+# Every numeral _CN_NUM_TIME_RE can capture (十? + one digit) → its value, in one lookup
+_CN_DIGITS = {
+    '一': 1, '二': 2, '三': 3, '四': 4, '五': 5,
+    '六': 6, '七': 7, '八': 8, '九': 9, '十': 10, '两': 2
+}
+_CN_NUMS = {**_CN_DIGITS, **{'十' + digit: 10 + value for digit, value in _CN_DIGITS.items()}}
+
+
 class TaskParser:
     """Parse natural language tasks using regex patterns (FREE - no API)."""
 
@@ -25,6 +62,7 @@ class TaskParser:
                 "end_time": str or None,  # HH:MM
                 "priority": str,  # High, Mid, Low
                 "category": str,  # Work, Life, Health, Study, Other
+                "confidence": int,  # 0-4: how many of date, time, category, priority were found
                 "success": bool
             }
         """
@@ -62,6 +100,14 @@ class TaskParser:
         # Infer priority from keywords
         result["priority"] = self._infer_priority(text)
 
+        # Signals actually found, as opposed to defaults
+        result["confidence"] = sum([
+            bool(date),
+            bool(start_time),
+            result["category"] != "Other",
+            result["priority"] != "Mid",
+        ])
+
         return result
 
     def _extract_date(self, text: str, today: datetime) -> tuple:
@@ -69,74 +115,73 @@ class TaskParser:
         date = None
 
         # Today patterns
-        if re.search(r'今天|today', text, re.IGNORECASE):
+        if _TODAY_RE.search(text):
             date = today.strftime("%Y-%m-%d")
-            text = re.sub(r'今天|today', '', text, flags=re.IGNORECASE)
+            text = _TODAY_RE.sub('', text)
 
         # Tomorrow patterns
-        elif re.search(r'明天|明日|tomorrow', text, re.IGNORECASE):
+        elif _TOMORROW_RE.search(text):
             date = (today + timedelta(days=1)).strftime("%Y-%m-%d")
-            text = re.sub(r'明天|明日|tomorrow', '', text, flags=re.IGNORECASE)
+            text = _TOMORROW_RE.sub('', text)
 
         # Day after tomorrow
-        elif re.search(r'后天|後天', text):
+        elif _DAY_AFTER_TOMORROW_RE.search(text):
             date = (today + timedelta(days=2)).strftime("%Y-%m-%d")
-            text = re.sub(r'后天|後天', '', text)
+            text = _DAY_AFTER_TOMORROW_RE.sub('', text)
 
         # This weekend/Saturday/Sunday
-        elif re.search(r'这?周六|本周六|this saturday|saturday', text, re.IGNORECASE):
+        elif _SATURDAY_RE.search(text):
             days_until_saturday = (5 - today.weekday()) % 7
             if days_until_saturday == 0:
                 days_until_saturday = 7
             date = (today + timedelta(days=days_until_saturday)).strftime("%Y-%m-%d")
-            text = re.sub(r'这?周六|本周六|this saturday|saturday', '', text, flags=re.IGNORECASE)
+            text = _SATURDAY_RE.sub('', text)
 
-        elif re.search(r'这?周日|本周日|周天|this sunday|sunday', text, re.IGNORECASE):
+        elif _SUNDAY_RE.search(text):
             days_until_sunday = (6 - today.weekday()) % 7
             if days_until_sunday == 0:
                 days_until_sunday = 7
             date = (today + timedelta(days=days_until_sunday)).strftime("%Y-%m-%d")
-            text = re.sub(r'这?周日|本周日|周天|this sunday|sunday', '', text, flags=re.IGNORECASE)
+            text = _SUNDAY_RE.sub('', text)
 
         # Next week patterns
-        elif re.search(r'下周一|next monday', text, re.IGNORECASE):
+        elif _NEXT_MONDAY_RE.search(text):
             days_until = (7 - today.weekday()) % 7 + 0
             if days_until <= 0:
                 days_until += 7
             date = (today + timedelta(days=days_until)).strftime("%Y-%m-%d")
-            text = re.sub(r'下周一|next monday', '', text, flags=re.IGNORECASE)
+            text = _NEXT_MONDAY_RE.sub('', text)
 
         # Tonight
-        elif re.search(r'今晚|tonight', text, re.IGNORECASE):
+        elif _TONIGHT_RE.search(text):
             date = today.strftime("%Y-%m-%d")
-            text = re.sub(r'今晚|tonight', '', text, flags=re.IGNORECASE)
+            text = _TONIGHT_RE.sub('', text)
 
         # Specific date: MM月DD日 or MM/DD
-        date_match = re.search(r'(\d{1,2})月(\d{1,2})[日号]?', text)
+        date_match = _MONTH_DAY_RE.search(text)
         if date_match:
             month, day = int(date_match.group(1)), int(date_match.group(2))
             year = today.year
             if month < today.month or (month == today.month and day < today.day):
                 year += 1
             date = f"{year}-{month:02d}-{day:02d}"
-            text = re.sub(r'\d{1,2}月\d{1,2}[日号]?', '', text)
+            text = _MONTH_DAY_RE.sub('', text)
 
         return text, date
 
     def _chinese_num_to_int(self, chinese: str) -> int:
         """Convert Chinese numeral to integer (1-12 for hours)."""
-        mapping = {
-            '一': 1, '二': 2, '三': 3, '四': 4, '五': 5,
-            '六': 6, '七': 7, '八': 8, '九': 9, '十': 10,
-            '十一': 11, '十二': 12, '两': 2
-        }
-        # Direct mapping for simple cases
-        if chinese in mapping:
-            return mapping[chinese]
-        # Handle 十X pattern (e.g., 十一 = 11, 十二 = 12)
-        if chinese.startswith('十') and len(chinese) == 2:
-            return 10 + mapping.get(chinese[1], 0)
-        return None
+        return _CN_NUMS.get(chinese)
+
+    def _to_24h(self, period: str, hour: int) -> int:
+        """Apply a Chinese time-of-day word (下午, 上午, ...) to a 12-hour clock hour."""
+        if period in ['下午', '晚上'] and hour < 12:
+            return hour + 12
+        if period == '上午' and hour == 12:
+            return 0
+        if period == '中午':
+            return 12
+        return hour
 
     def _extract_time(self, text: str) -> tuple:
         """Extract time from text and return (remaining_text, start_time, end_time)."""
@@ -144,20 +189,14 @@ class TaskParser:
         end_time = None
 
         # Chinese time with Chinese numerals: 上午十一点, 下午三点
-        cn_time_match = re.search(r'(上午|下午|晚上|早上|中午)?(十?[一二三四五六七八九十两])[点點時]', text)
+        cn_time_match = _CN_NUM_TIME_RE.search(text)
         if cn_time_match:
             period = cn_time_match.group(1) or ""
             cn_num = cn_time_match.group(2)
             hour = self._chinese_num_to_int(cn_num)
 
             if hour:
-                # Convert to 24-hour format
-                if period in ['下午', '晚上'] and hour < 12:
-                    hour += 12
-                elif period == '上午' and hour == 12:
-                    hour = 0
-                elif period == '中午':
-                    hour = 12
+                hour = self._to_24h(period, hour)
 
                 start_time = f"{hour:02d}:00"
                 end_hour = min(hour + 2, 23)
@@ -168,19 +207,13 @@ class TaskParser:
                 return text, start_time, end_time
 
         # Chinese time patterns with Arabic numerals: 上午11点, 3点
-        time_match = re.search(r'(上午|下午|晚上|早上|中午)?(\d{1,2})[点點時:：](\d{2})?', text)
+        time_match = _CN_TIME_RE.search(text)
         if time_match:
             period = time_match.group(1) or ""
             hour = int(time_match.group(2))
             minute = int(time_match.group(3)) if time_match.group(3) else 0
 
-            # Convert to 24-hour format
-            if period in ['下午', '晚上'] and hour < 12:
-                hour += 12
-            elif period == '上午' and hour == 12:
-                hour = 0
-            elif period == '中午':
-                hour = 12
+            hour = self._to_24h(period, hour)
 
             start_time = f"{hour:02d}:{minute:02d}"
 
@@ -190,13 +223,14 @@ class TaskParser:
                 end_hour = 23
             end_time = f"{end_hour:02d}:{minute:02d}"
 
-            text = re.sub(r'(上午|下午|晚上|早上|中午)?(\d{1,2})[点時:：](\d{2})?', '', text)
+            # Every occurrence, so the end of a range ("3点到5点") leaves the task text too
+            text = _CN_TIME_RE.sub('', text)
 
         # English time patterns: 3pm, 3:30pm
-        time_match = re.search(r'(\d{1,2}):?(\d{2})?\s*(am|pm|AM|PM)?', text)
-        if time_match and not start_time:
-            hour = int(time_match.group(1))
-            minute = int(time_match.group(2)) if time_match.group(2) else 0
+        time_match = None if start_time else _EN_TIME_RE.search(text)
+        if time_match:
+            hour = int(time_match.group(1) or time_match.group(4))
+            minute = int(time_match.group(2) or time_match.group(5) or 0)
             period = time_match.group(3)
 
             if period and period.lower() == 'pm' and hour < 12:
@@ -208,15 +242,15 @@ class TaskParser:
                 start_time = f"{hour:02d}:{minute:02d}"
                 end_hour = min(hour + 2, 23)
                 end_time = f"{end_hour:02d}:{minute:02d}"
-                text = re.sub(r'(\d{1,2}):?(\d{2})?\s*(am|pm|AM|PM)?', '', text, count=1)
+                text = text[:time_match.start()] + text[time_match.end():]
 
         return text, start_time, end_time
 
     def _clean_task_text(self, text: str) -> str:
         """Clean up task text by removing extra punctuation and whitespace."""
         # Remove common filler words and punctuation
-        text = re.sub(r'[，,。.！!？?、]+', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
+        text = _PUNCT_RE.sub(' ', text)
+        text = _SPACES_RE.sub(' ', text)
         text = text.strip()
 
         # If task is empty after cleaning, return a default
@@ -229,13 +263,13 @@ class TaskParser:
         """Infer category from keywords."""
         text_lower = text.lower()
 
-        if re.search(r'开会|会议|工作|meeting|work|office|报告|report', text_lower):
+        if _WORK_RE.search(text_lower):
             return "Work"
-        elif re.search(r'学习|看书|读书|study|learn|课|class|homework', text_lower):
+        elif _STUDY_RE.search(text_lower):
             return "Study"
-        elif re.search(r'运动|健身|跑步|gym|exercise|workout|health|医', text_lower):
+        elif _HEALTH_RE.search(text_lower):
             return "Health"
-        elif re.search(r'吃饭|约|朋友|玩|看|show|movie|dinner|lunch|party', text_lower):
+        elif _LIFE_RE.search(text_lower):
             return "Life"
         else:
             return "Other"
@@ -244,9 +278,9 @@ class TaskParser:
         """Infer priority from keywords."""
         text_lower = text.lower()
 
-        if re.search(r'紧急|urgent|重要|important|必须|must|asap', text_lower):
+        if _HIGH_PRIORITY_RE.search(text_lower):
             return "High"
-        elif re.search(r'不急|随便|maybe|可能', text_lower):
+        elif _LOW_PRIORITY_RE.search(text_lower):
             return "Low"
         else:
             return "Mid"
@@ -268,7 +302,7 @@ class TaskParser:
         lines.append(f"• 事项：{parsed.get('task', '')}")
 
         # Priority
-        priority_emoji = {"High": "🔴", "Mid": "🟡", "Low": "🟢"}.get(parsed.get("priority", "Mid"), "🟡")
+        priority_emoji = PRIORITY_EMOJI.get(parsed.get("priority", "Mid"), "🟡")
         lines.append(f"• 优先级：{priority_emoji} {parsed.get('priority', 'Mid')}")
 
         # Category
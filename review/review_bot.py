@@ -6,18 +6,24 @@ import sys, os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import io
-import json
+import datetime
+import queue
+import atexit
 import re
 import html
 import asyncio
 import logging
+import time
+import pytz
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from dotenv import load_dotenv
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, ReplyKeyboardMarkup
-from telegram.ext import Application, CommandHandler, CallbackQueryHandler, MessageHandler, filters, ContextTypes
+from telegram.ext import (
+    AIORateLimiter, Application, CommandHandler, CallbackQueryHandler, MessageHandler, filters, ContextTypes,
+)
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
-from shared.notion_handler import NotionHandler
-from review.review_stats_handler import ReviewStatsHandler
 from review.obsidian_review_stats_handler import ObsidianReviewStatsHandler  # used by daily sync
 
 # Load environment variables
@@ -30,20 +36,63 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+def _start_log_listener() -> QueueListener:
+    """Route root logging through a queue so formatting and stream writes run on a background thread."""
+    root = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
 # Configuration
 REVIEW_BOT_TOKEN = os.getenv("REVIEW_BOT_TOKEN")
 REVIEW_USER_ID = os.getenv("REVIEW_USER_ID")
+# Parsed once so access checks compare ints instead of str()-ing every update's user id
+REVIEW_USER_ID_INT = int(REVIEW_USER_ID) if REVIEW_USER_ID and REVIEW_USER_ID.lstrip("-").isdigit() else None
 NOTION_KEY = os.getenv("NOTION_API_KEY")
 NOTION_DB_ID = os.getenv("NOTION_DATABASE_ID")
 TIMEZONE = os.getenv("TIMEZONE", "Europe/London")
 REVIEW_STATS_DB_ID = os.getenv("REVIEW_STATS_DB_ID")
 CONFIG_DB_ID = os.getenv("CONFIG_DB_ID")
 
+# Optional webhook mode (falls back to long polling when unset)
+REVIEW_WEBHOOK_URL = os.getenv("REVIEW_WEBHOOK_URL", "").rstrip("/")
+REVIEW_WEBHOOK_PORT = os.getenv("REVIEW_WEBHOOK_PORT")
+
 # Additional database IDs for review (comma-separated)
 # Example: ADDITIONAL_DATABASE_IDS=db_id_2,db_id_3
 ADDITIONAL_DB_IDS_RAW = os.getenv("ADDITIONAL_DATABASE_IDS", "")
 ADDITIONAL_DB_IDS = [db_id.strip() for db_id in ADDITIONAL_DB_IDS_RAW.split(",") if db_id.strip()]
 
+# Seconds a /due stats result is reused (cleared whenever a card is rated)
+STATS_CACHE_TTL = 30
+
+# Cards per Telegram message (1 = one message per card, as before; 0 = as many
+# as fit in GROUP_MAX_CHARS). Grouped messages get one numbered Again/Good/Easy row per card
+REVIEW_GROUP_SIZE = max(0, int(os.getenv("REVIEW_GROUP_SIZE", "1")))
+# Start a new message before a group grows past this many characters (Telegram max 4096)
+GROUP_MAX_CHARS = 4000
+# Cards per grouped message at most (3 buttons each; Telegram caps a keyboard at 100 buttons)
+GROUP_MAX_CARDS = 30
+
+# Seconds of quiet after a /schedule edit before the config is written back
+CONFIG_SAVE_DELAY = 2.0
+
+# Scheduled batches within this many seconds of the previous batch are skipped
+BATCH_COOLDOWN = 60
+
+# Seconds ratings are held so taps across a batch reach Notion as one bulk write
+RATING_FLUSH_DELAY = 3.0
+
+# Rating buttons older than this are retired on tap (same window as sent_but_unrated)
+CARD_RATING_WINDOW = datetime.timedelta(days=2)
+
+# Seconds a batch prefetched after the previous one stays usable (shortest gap between review hours)
+PREFETCH_MAX_AGE = 3 * 3600
+
 # Available TTS voices (en-GB only)
 TTS_VOICES = {
     "en-GB-SoniaNeural": "🇬🇧 Sonia (女)",
@@ -52,6 +101,26 @@ TTS_VOICES = {
     "en-GB-ThomasNeural": "🇬🇧 Thomas (男)",
 }
 
+# Fallback schedule when neither env vars nor saved config give a valid one
+DEFAULT_REVIEW_HOURS = [8, 13, 17, 19, 22]
+DEFAULT_WORDS_PER_BATCH = 20
+
+
+def _valid_hours(hours) -> list:
+    """Return hours as a sorted, de-duplicated list if it is a non-empty list of ints in 0-23, else None."""
+    if not isinstance(hours, list) or not hours or not all(isinstance(h, int) and 0 <= h <= 23 for h in hours):
+        return None
+    return sorted(set(hours))
+
+
+def _valid_words(words):
+    """Return words if it is an int in 1-50, else None."""
+    return words if isinstance(words, int) and 1 <= words <= 50 else None
+
+
+_HOURS_SPLIT_RE = re.compile(r"[,\s]+")
+
+
 # Schedule configuration from environment variables
 # REVIEW_HOURS: comma-separated hours (e.g., "8,13,17,19,22")
 # WORDS_PER_BATCH: number of words per review session (e.g., "20")
@@ -60,22 +129,18 @@ def get_default_config() -> dict:
     hours_str = os.getenv("REVIEW_HOURS", "8,13,17,19,22")
     words_str = os.getenv("WORDS_PER_BATCH", "20")
 
+    # Out-of-range hours are dropped; any non-number discards the whole value
     try:
-        hours = [int(h.strip()) for h in hours_str.split(",") if h.strip()]
-        hours = [h for h in hours if 0 <= h <= 23]
-        if not hours:
-            hours = [8, 13, 17, 19, 22]
-    except ValueError:
-        hours = [8, 13, 17, 19, 22]
-
-    try:
-        words = int(words_str)
-        if words < 1 or words > 50:
-            words = 20
+        hours = sorted({h for h in map(int, _HOURS_SPLIT_RE.split(hours_str.strip(", \t"))) if 0 <= h <= 23})
     except ValueError:
-        words = 20
+        hours = None
+    words = _valid_words(int(words_str)) if words_str.strip().isdigit() else None
 
-    return {"review_hours": sorted(set(hours)), "words_per_batch": words, "tts_voices": ["en-GB-SoniaNeural"]}
+    return {
+        "review_hours": hours or list(DEFAULT_REVIEW_HOURS),
+        "words_per_batch": words or DEFAULT_WORDS_PER_BATCH,
+        "tts_voices": ["en-GB-SoniaNeural"],
+    }
 
 
 REVIEW_CONFIG_KEY = "__CONFIG_review_schedule__"
@@ -90,13 +155,9 @@ def load_config() -> dict:
         config = config_handler.load(REVIEW_CONFIG_KEY)
         if not config:
             return default
-        # Validate
-        hours = config.get("review_hours")
-        words = config.get("words_per_batch")
-        if not isinstance(hours, list) or not all(isinstance(h, int) and 0 <= h <= 23 for h in hours):
-            hours = default["review_hours"]
-        if not isinstance(words, int) or words < 1 or words > 50:
-            words = default["words_per_batch"]
+        # Validate each field, falling back to the env default for that field only
+        hours = _valid_hours(config.get("review_hours")) or default["review_hours"]
+        words = _valid_words(config.get("words_per_batch")) or default["words_per_batch"]
         # Support both legacy tts_voice (string) and new tts_voices (list)
         voices = config.get("tts_voices")
         if not voices:
@@ -106,7 +167,7 @@ def load_config() -> dict:
         if not voices:
             voices = ["en-GB-SoniaNeural"]
         return {
-            "review_hours": sorted(set(hours)),
+            "review_hours": hours,
             "words_per_batch": words,
             "is_paused": config.get("is_paused", False),
             "tts_voices": voices,
@@ -126,6 +187,36 @@ def save_config(config: dict) -> bool:
     return False
 
 
+def schedule_config_save() -> None:
+    """Mark review_config dirty and save it after CONFIG_SAVE_DELAY, coalescing rapid edits.
+
+    For callers that don't report whether the save succeeded (the /schedule
+    UI); /stop and /resume still call save_config() directly.
+    """
+    global _config_dirty, _config_save_task
+    _config_dirty = True
+    if _config_save_task is None or _config_save_task.done():
+        _config_save_task = asyncio.create_task(_config_writer())
+
+
+async def _config_writer() -> None:
+    """Write review_config until no edits arrived during the last save window."""
+    global _config_dirty
+    while _config_dirty:
+        await asyncio.sleep(CONFIG_SAVE_DELAY)
+        _config_dirty = False
+        await _persist_config(dict(review_config))
+
+
+async def _persist_config(config: dict) -> None:
+    """Save a config snapshot off the event loop, then back it up to GitHub."""
+    if not config_handler:
+        return
+    if not await asyncio.to_thread(config_handler.save, REVIEW_CONFIG_KEY, config):
+        logger.warning("Saving review config failed")
+    from shared.github_config_backup import save_config_to_github
+    await save_config_to_github(config, ".review_bot_config.json", "review-bot")
+
 
 # Global state
 notion_handler = None
@@ -146,6 +237,64 @@ def _next_batch_voice() -> str:
 review_config = None
 stats_handler = None
 sent_but_unrated: dict = {}  # page_id → {"entry": entry, "sent_at": datetime}; accumulates across batches, expires after 2 days
+_cache: dict = {}  # key → (monotonic ts, value); see _cached()
+outbound_queue = None  # asyncio.Queue of (send_message kwargs, Future), drained by _sender_worker
+_sender_task = None
+_config_dirty = False  # review_config has edits not yet written (see schedule_config_save)
+_config_save_task = None
+_send_lock = asyncio.Lock()  # serializes send_review_batch runs
+_last_batch_ts = 0.0  # monotonic time the last review batch finished
+_prefetch = None  # (monotonic ts, date, batch size, Task) for the next batch; see _start_prefetch
+_background_tasks: set = set()  # fire-and-forget tasks, referenced until done (see _spawn)
+_pending_ratings: list = []  # (page_id, response, review_count, Future) awaiting flush_ratings
+_ratings_task = None
+_job_count = 0  # scheduled jobs, counted once in post_init (apply_schedule swaps jobs 1:1)
+_review_job = None  # the APScheduler Job firing review batches at every review hour; see apply_schedule
+
+
+async def _cached(key: str, ttl: float, fn):
+    """Return fn()'s cached result for key if younger than ttl seconds, else run it in a thread."""
+    hit = _cache.get(key)
+    now = time.monotonic()
+    if hit and now - hit[0] < ttl:
+        return hit[1]
+    value = await asyncio.to_thread(fn)
+    _cache[key] = (now, value)
+    return value
+
+
+async def _sender_worker() -> None:
+    """Send queued messages one at a time, in order, resolving each item's future.
+
+    Pacing is left to the application's AIORateLimiter.
+    """
+    while True:
+        kwargs, future = await outbound_queue.get()
+        try:
+            result = await application.bot.send_message(**kwargs)
+            if not future.done():
+                future.set_result(result)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        finally:
+            outbound_queue.task_done()
+
+
+async def enqueue_message(**kwargs) -> asyncio.Future:
+    """Queue a send_message call; the returned future resolves once it is sent.
+
+    Falls back to sending directly if the sender worker isn't running.
+    """
+    future = asyncio.get_running_loop().create_future()
+    if outbound_queue is None:
+        try:
+            future.set_result(await application.bot.send_message(**kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+    await outbound_queue.put((kwargs, future))
+    return future
 
 def get_main_keyboard() -> ReplyKeyboardMarkup:
     """Persistent reply keyboard with the two most-used actions."""
@@ -222,39 +371,81 @@ def format_entry_for_review(entry: dict, index: int, total: int) -> str:
     English word is visible; Chinese, explanation, examples are hidden
     behind Telegram's native spoiler tap-to-reveal.
     """
-    english = html.escape(entry.get("english", ""))
-    chinese = html.escape(entry.get("chinese", ""))
-    explanation = html.escape(entry.get("explanation", ""))
-    example = html.escape(entry.get("example", ""))
-    category = html.escape(entry.get("category", ""))
-    review_count = entry.get("review_count", 0) or 0
-    last_reviewed = entry.get("last_reviewed")
-
-    if not last_reviewed:
+    get = entry.get
+    chinese = get("chinese")
+    explanation = get("explanation")
+    example = get("example")
+    category = get("category")
+    review_count = get("review_count", 0) or 0
+
+    if not get("last_reviewed"):
         status = "🆕 New"
     elif review_count <= 3:
         status = f"📖 Review #{review_count + 1}"
     else:
         status = f"✅ Review #{review_count + 1}"
 
-    lines = [f"Review {index}/{total}  •  {status}", "", f"<b>{english}</b>"]
+    text = f"Review {index}/{total}  •  {status}\n\n<b>{html.escape(get('english', ''))}</b>"
 
-    # Build answer section (hidden behind spoiler)
-    answer_lines = []
-    if chinese:
-        answer_lines.append(chinese)
+    # Answer section (hidden behind spoiler); empty fields are skipped
+    answer = html.escape(chinese) if chinese else ""
     if explanation:
-        answer_lines.extend(["", f"<b>Explanation:</b>", explanation])
+        answer += f"\n\n<b>Explanation:</b>\n{html.escape(explanation)}"
     if example:
-        answer_lines.extend(["", f"<b>Example:</b>", example])
+        answer += f"\n\n<b>Example:</b>\n{html.escape(example)}"
     if category:
-        answer_lines.extend(["", f"Category: {category}"])
+        answer += f"\n\nCategory: {html.escape(category)}"
+    if not chinese:
+        answer = answer[1:]  # no Chinese line, so only one blank line before the first section
+    if answer:
+        text += f"\n\n<tg-spoiler>{answer}</tg-spoiler>"
+    return text
+
+
+GROUP_SEPARATOR = "\n\n———\n\n"
+
+
+def _rating_row(page_id: str, index: int = None) -> list:
+    """Again/Good/Easy buttons for one card; numbered when several cards share a message."""
+    suffix = f" {index}" if index is not None else ""
+    return [
+        InlineKeyboardButton(f"🔴 Again{suffix}", callback_data=f"again_{page_id}"),
+        InlineKeyboardButton(f"🟡 Good{suffix}", callback_data=f"good_{page_id}"),
+        InlineKeyboardButton(f"🟢 Easy{suffix}", callback_data=f"easy_{page_id}"),
+    ]
 
-    if answer_lines:
-        answer_text = "\n".join(answer_lines)
-        lines.extend(["", f"<tg-spoiler>{answer_text}</tg-spoiler>"])
 
-    return "\n".join(lines)
+def build_review_messages(entries: list, total: int, start: int = 1) -> list:
+    """Format entries into (text, reply_markup) messages of up to REVIEW_GROUP_SIZE cards each.
+
+    With REVIEW_GROUP_SIZE = 0, cards are packed into as few messages as the
+    character cap allows (a 20-word batch is usually 2-3 messages).
+
+    Args:
+        entries: Entries to format, numbered from start
+        total: Total shown in each card header ("Review i/total")
+        start: Number of the first entry
+    """
+    group_size = min(REVIEW_GROUP_SIZE or GROUP_MAX_CARDS, GROUP_MAX_CARDS)
+    messages = []
+    texts, rows = [], []
+    for i, entry in enumerate(entries, start):
+        card = format_entry_for_review(entry, i, total)
+        page_id = entry.get("page_id", "")
+        if REVIEW_GROUP_SIZE == 1:
+            messages.append((card, InlineKeyboardMarkup([_rating_row(page_id)])))
+            continue
+        if texts and (
+            len(texts) >= group_size
+            or sum(map(len, texts)) + len(card) + len(GROUP_SEPARATOR) * len(texts) > GROUP_MAX_CHARS
+        ):
+            messages.append((GROUP_SEPARATOR.join(texts), InlineKeyboardMarkup(rows)))
+            texts, rows = [], []
+        texts.append(card)
+        rows.append(_rating_row(page_id, i))
+    if texts:
+        messages.append((GROUP_SEPARATOR.join(texts), InlineKeyboardMarkup(rows)))
+    return messages
 
 
 async def send_review_batch(manual: bool = False):
@@ -263,12 +454,11 @@ async def send_review_batch(manual: bool = False):
     Args:
         manual: If True, bypass the pause check (for /review command)
     """
-    global is_paused
+    global _last_batch_ts
 
-    import datetime
-    now = datetime.datetime.now()
+    now = _now_local()
     trigger_type = "manual" if manual else "scheduled"
-    logger.info(f"send_review_batch triggered ({trigger_type}) at {now.strftime('%Y-%m-%d %H:%M:%S')}")
+    logger.info("send_review_batch triggered (%s) at %s", trigger_type, now.strftime('%Y-%m-%d %H:%M:%S'))
 
     if is_paused and not manual:
         logger.info("Review is paused, skipping scheduled batch")
@@ -278,10 +468,25 @@ async def send_review_batch(manual: bool = False):
         logger.error("REVIEW_USER_ID not configured")
         return
 
+    # One batch at a time; /review right after a scheduled run waits its turn,
+    # while a scheduled run right after any other batch is dropped
+    async with _send_lock:
+        if not manual and time.monotonic() - _last_batch_ts < BATCH_COOLDOWN:
+            logger.info("A review batch was just sent, skipping scheduled batch")
+            return
+        await _send_review_batch(now)
+        _last_batch_ts = time.monotonic()
+
+
+async def _send_review_batch(now) -> None:
+    """Fetch, send and voice one review batch (caller holds _send_lock)."""
     try:
         # Use smart selection with spaced repetition
         batch_size = review_config["words_per_batch"] if review_config else get_default_config()["words_per_batch"]
-        entries = notion_handler.fetch_entries_for_review(batch_size, smart=True)
+        await flush_ratings()  # due words depend on ratings not yet written
+        entries = await _take_prefetch(batch_size)
+        if entries is None:
+            entries = await asyncio.to_thread(notion_handler.fetch_entries_for_review, batch_size, smart=True)
 
         if not entries:
             logger.warning("No entries fetched from Notion")
@@ -292,39 +497,46 @@ async def send_review_batch(manual: bool = False):
             return
 
         # Accumulate sent cards; expire entries older than 2 days; never overwrite existing ones
-        global sent_but_unrated
         cutoff = now - datetime.timedelta(days=2)
-        sent_but_unrated = {pid: v for pid, v in sent_but_unrated.items() if v["sent_at"] >= cutoff}
+        for pid in [pid for pid, v in sent_but_unrated.items() if v["sent_at"] < cutoff]:
+            del sent_but_unrated[pid]
         for entry in entries:
             pid = entry.get("page_id", "")
             if pid and pid not in sent_but_unrated:
                 sent_but_unrated[pid] = {"entry": entry, "sent_at": now}
 
-        total = len(entries)
-        for i, entry in enumerate(entries, 1):
-            message = format_entry_for_review(entry, i, total)
-            page_id = entry.get("page_id", "")
-
-            # Rating buttons shown alongside spoiler-hidden answer
-            keyboard = [[
-                InlineKeyboardButton("🔴 Again", callback_data=f"again_{page_id}"),
-                InlineKeyboardButton("🟡 Good", callback_data=f"good_{page_id}"),
-                InlineKeyboardButton("🟢 Easy", callback_data=f"easy_{page_id}"),
-            ]]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+        # Voice the batch while the cards go out; edge-tts and Telegram don't contend
+        batch_voice = _next_batch_voice()
+        audio_task = asyncio.create_task(generate_chunked_audio(entries, voice=batch_voice))
 
-            await application.bot.send_message(
+        # Hand the cards to the sender worker
+        total = len(entries)
+        futures = [
+            await enqueue_message(
                 chat_id=REVIEW_USER_ID,
-                text=message,
+                text=text,
                 reply_markup=reply_markup,
                 parse_mode="HTML"
             )
+            for text, reply_markup in build_review_messages(entries, total)
+        ]
+
+        # Wait for the cards so the audio below still arrives after the last one
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        failed = [r for r in results if isinstance(r, Exception)]
+        for err in failed:
+            logger.error(f"Failed to send review card: {err}")
+
+        logger.info(
+            f"Sent {len(futures) - len(failed)}/{len(futures)} review messages "
+            f"({total} entries) to user {REVIEW_USER_ID}"
+        )
 
-        logger.info(f"Sent {total} review entries to user {REVIEW_USER_ID}")
+        # Fetch the next batch now, so the next run doesn't wait on Notion
+        _start_prefetch(batch_size, [e["page_id"] for e in entries if e.get("page_id")])
 
         # Send pronunciation audio in chunks of 10
-        batch_voice = _next_batch_voice()
-        audio_chunks = await generate_chunked_audio(entries, voice=batch_voice)
+        audio_chunks = await audio_task
         if audio_chunks:
             for audio_buf, caption in audio_chunks:
                 await application.bot.send_audio(
@@ -368,28 +580,26 @@ async def send_pending_resend():
 
     logger.info(f"Resending {total}/{total_pending} pending cards (batch_size={batch_size})")
 
-    import datetime
-    now = datetime.datetime.now()
+    now = _now_local()
     chunk_size = 10
 
     for chunk_idx, chunk_start in enumerate(range(0, total, chunk_size), 1):
         chunk = entries[chunk_start:chunk_start + chunk_size]
 
-        # Send the cards in this chunk
-        for i, entry in enumerate(chunk, chunk_start + 1):
-            message = format_entry_for_review(entry, i, total)
-            page_id = entry.get("page_id", "")
-            keyboard = [[
-                InlineKeyboardButton("🔴 Again", callback_data=f"again_{page_id}"),
-                InlineKeyboardButton("🟡 Good", callback_data=f"good_{page_id}"),
-                InlineKeyboardButton("🟢 Easy", callback_data=f"easy_{page_id}"),
-            ]]
-            await application.bot.send_message(
+        # Send the cards in this chunk through the sender worker, and wait
+        # for them so the chunk's audio follows its cards
+        futures = [
+            await enqueue_message(
                 chat_id=REVIEW_USER_ID,
-                text=message,
-                reply_markup=InlineKeyboardMarkup(keyboard),
+                text=text,
+                reply_markup=reply_markup,
                 parse_mode="HTML",
             )
+            for text, reply_markup in build_review_messages(chunk, total, chunk_start + 1)
+        ]
+        for result in await asyncio.gather(*futures, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to resend review card: {result}")
 
         # Send audio for this chunk immediately after
         pending_voice = _next_batch_voice()
@@ -422,7 +632,7 @@ async def send_weekly_report():
     start = today - timedelta(days=6)  # Monday
     end = today  # Sunday
 
-    days = stats_handler.get_date_range(start, end)
+    days = await asyncio.to_thread(stats_handler.get_date_range, start, end)
     total = sum(d["reviewed"] for d in days)
     total_again = sum(d["again"] for d in days)
     total_good = sum(d["good"] for d in days)
@@ -463,7 +673,15 @@ async def send_monthly_report():
     last_month_start = last_month_end.replace(day=1)
     num_days = (last_month_end - last_month_start).days + 1
 
-    days = stats_handler.get_date_range(last_month_start, last_month_end)
+    # Previous month for comparison
+    prev_month_end = last_month_start - timedelta(days=1)
+    prev_month_start = prev_month_end.replace(day=1)
+
+    # Both months are independent Notion queries; fetch them side by side
+    days, prev_days = await asyncio.gather(
+        asyncio.to_thread(stats_handler.get_date_range, last_month_start, last_month_end),
+        asyncio.to_thread(stats_handler.get_date_range, prev_month_start, prev_month_end),
+    )
     total = sum(d["reviewed"] for d in days)
     total_again = sum(d["again"] for d in days)
     total_good = sum(d["good"] for d in days)
@@ -472,10 +690,6 @@ async def send_monthly_report():
     best = max(days, key=lambda d: d["reviewed"])
     avg = total / num_days if total else 0
 
-    # Previous month for comparison
-    prev_month_end = last_month_start - timedelta(days=1)
-    prev_month_start = prev_month_end.replace(day=1)
-    prev_days = stats_handler.get_date_range(prev_month_start, prev_month_end)
     prev_total = sum(d["reviewed"] for d in prev_days)
 
     month_name = last_month_start.strftime("%B %Y")
@@ -508,9 +722,9 @@ async def myid_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /start command."""
-    user_id = str(update.effective_user.id)
-    logger.info(f"/start from user {user_id}, expected {REVIEW_USER_ID}")
-    if user_id != REVIEW_USER_ID:
+    user_id = update.effective_user.id
+    logger.info("/start from user %s, expected %s", user_id, REVIEW_USER_ID)
+    if user_id != REVIEW_USER_ID_INT:
         await update.message.reply_text(f"Sorry, this bot is private.\n\nYour ID: {user_id}\nUse /myid to get your ID for setup.")
         return
 
@@ -537,9 +751,9 @@ Buttons:
 
 async def review_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /review command - manual trigger (works even when paused)."""
-    user_id = str(update.effective_user.id)
-    logger.info(f"/review from user {user_id}, expected {REVIEW_USER_ID}")
-    if user_id != REVIEW_USER_ID:
+    user_id = update.effective_user.id
+    logger.info("/review from user %s, expected %s", user_id, REVIEW_USER_ID)
+    if user_id != REVIEW_USER_ID_INT:
         await update.message.reply_text(f"Sorry, this bot is private. Your ID: {user_id}")
         return
 
@@ -551,7 +765,7 @@ async def stop_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     """Handle /stop command - pause scheduled reviews."""
     global is_paused
 
-    if str(update.effective_user.id) != REVIEW_USER_ID:
+    if update.effective_user.id != REVIEW_USER_ID_INT:
         await update.message.reply_text("Sorry, this bot is private.")
         return
 
@@ -566,14 +780,14 @@ async def stop_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         await update.message.reply_text("⏸ Scheduled reviews paused (saved). Use /resume to continue.")
     else:
         await update.message.reply_text("⏸ Scheduled reviews paused for this session.\n⚠️ Config save failed — pause may not survive a restart.")
-    logger.info(f"Scheduled reviews paused (persisted={saved})")
+    logger.info("Scheduled reviews paused (persisted=%s)", saved)
 
 
 async def resume_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /resume command - resume scheduled reviews."""
     global is_paused
 
-    if str(update.effective_user.id) != REVIEW_USER_ID:
+    if update.effective_user.id != REVIEW_USER_ID_INT:
         await update.message.reply_text("Sorry, this bot is private.")
         return
 
@@ -588,22 +802,21 @@ async def resume_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         await update.message.reply_text("▶️ Scheduled reviews resumed!")
     else:
         await update.message.reply_text("▶️ Scheduled reviews resumed for this session.\n⚠️ Config save failed — may revert after restart.")
-    logger.info(f"Scheduled reviews resumed (persisted={saved})")
+    logger.info("Scheduled reviews resumed (persisted=%s)", saved)
 
 
 async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /status command - show bot status."""
-    if str(update.effective_user.id) != REVIEW_USER_ID:
+    if update.effective_user.id != REVIEW_USER_ID_INT:
         await update.message.reply_text("Sorry, this bot is private.")
         return
 
     status = "paused" if is_paused else "active"
-    jobs = scheduler.get_jobs() if scheduler else []
 
     status_message = f"""
 Bot Status: {status}
 Timezone: {TIMEZONE}
-Scheduled jobs: {len(jobs)}
+Scheduled jobs: {_job_count}
 
 {format_schedule_text(review_config)}
 
@@ -619,14 +832,17 @@ Commands: /review /due /schedule /stop /resume
 
 async def due_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /due command - show how many words are due for review."""
-    if str(update.effective_user.id) != REVIEW_USER_ID:
+    if update.effective_user.id != REVIEW_USER_ID_INT:
         await update.message.reply_text("Sorry, this bot is private.")
         return
 
     await update.message.reply_text("Checking due words...")
 
     try:
-        stats = notion_handler.get_review_stats()
+        await flush_ratings()  # counts must include ratings still in the write-behind window
+        stats = await _cached("review_stats", STATS_CACHE_TTL, notion_handler.get_review_stats)
+        if "error" in stats:
+            _cache.pop("review_stats", None)  # don't keep serving a failure
         due_today = stats.get("due_today", 0)
         overdue = stats.get("overdue", 0)
         new_words = stats.get("new_words", 0)
@@ -649,7 +865,7 @@ async def due_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
 
 async def stats_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /stats command — show this week's review stats."""
-    if str(update.effective_user.id) != REVIEW_USER_ID:
+    if update.effective_user.id != REVIEW_USER_ID_INT:
         await update.message.reply_text("Sorry, this bot is private.")
         return
 
@@ -657,11 +873,12 @@ async def stats_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         await update.message.reply_text("Stats tracking not configured (REVIEW_STATS_DB_ID missing).")
         return
 
+    await flush_ratings()  # today's counts must include ratings still in the write-behind window
     from datetime import date, timedelta
     today = date.today()
     # Current week (Mon-today)
     monday = today - timedelta(days=today.weekday())
-    days = stats_handler.get_date_range(monday, today)
+    days = await asyncio.to_thread(stats_handler.get_date_range, monday, today)
     total = sum(d["reviewed"] for d in days)
     total_again = sum(d["again"] for d in days)
     total_good = sum(d["good"] for d in days)
@@ -701,12 +918,9 @@ def get_next_review_time() -> str:
     """Get the next scheduled review time from the scheduler."""
     if not scheduler:
         return ""
-    review_jobs = [j for j in scheduler.get_jobs() if j.id.startswith("review_")]
-    next_times = [getattr(j, 'next_run_time', None) for j in review_jobs]
-    next_times = [t for t in next_times if t]
-    if not next_times:
+    next_time = getattr(_review_job, 'next_run_time', None)
+    if not next_time:
         return ""
-    next_time = min(next_times)
     return next_time.strftime("%Y-%m-%d %H:%M")
 
 
@@ -732,8 +946,13 @@ async def send_schedule_display(message_or_query, config: dict, edit: bool = Fal
         await message_or_query.reply_text(text, reply_markup=markup)
 
 
-def build_hour_grid(active_hours: list) -> InlineKeyboardMarkup:
-    """Build 3-row grid of hour buttons (7-12, 13-18, 19-23) + Done/Back."""
+@lru_cache(maxsize=256)
+def build_hour_grid(active_hours: tuple) -> InlineKeyboardMarkup:
+    """Build 3-row grid of hour buttons (7-12, 13-18, 19-23) + Done/Back.
+
+    Cached per hour set; pass a sorted tuple. Markups are immutable, so the
+    same object can be reused across edits.
+    """
     rows = []
     for row_hours in [(7, 8, 9, 10, 11, 12), (13, 14, 15, 16, 17, 18), (19, 20, 21, 22, 23)]:
         row = []
@@ -748,6 +967,7 @@ def build_hour_grid(active_hours: list) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(rows)
 
 
+@lru_cache(maxsize=16)
 def build_word_options(current: int) -> InlineKeyboardMarkup:
     """Build word count option buttons."""
     options = [5, 10, 15, 20, 30]
@@ -771,19 +991,44 @@ def build_voice_options(active_voices: list) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(rows)
 
 
+_WORDS_RE = re.compile(r'(\d+)\s*words?', re.IGNORECASE)
+_HOURS_RE = re.compile(r'(?:at\s+)?((?:\d{1,2}\s*[,\s]\s*)*\d{1,2})\s*$')
+_NUM_RE = re.compile(r'\d{1,2}')
+
+
+def _fast_parse_schedule(text: str):
+    """Parse the canonical 'N words at H H H' form with plain splits; None if text isn't in that form."""
+    tokens = text.split()
+    if len(tokens) < 4 or tokens[1].lower() not in ("word", "words") or tokens[2].lower() != "at":
+        return None
+    if not tokens[0].isdecimal() or not all(t.isascii() and t.isdigit() and len(t) <= 2 for t in tokens[3:]):
+        return None
+    result = {}
+    n = int(tokens[0])
+    if 1 <= n <= 50:
+        result["words_per_batch"] = n
+    hours = [h for h in map(int, tokens[3:]) if h <= 23]
+    if hours:
+        result["review_hours"] = sorted(set(hours))
+    return result or None
+
+
 def parse_schedule_text(text: str):
     """Parse free-form schedule text like '20 words at 8 13 17 19 22'."""
+    fast = _fast_parse_schedule(text)
+    if fast is not None:
+        return fast
     result = {}
     # Match words count
-    words_match = re.search(r'(\d+)\s*words?', text, re.IGNORECASE)
+    words_match = _WORDS_RE.search(text)
     if words_match:
         n = int(words_match.group(1))
         if 1 <= n <= 50:
             result["words_per_batch"] = n
     # Match hours (series of numbers, possibly after "at")
-    hours_match = re.search(r'(?:at\s+)?((?:\d{1,2}\s*[,\s]\s*)*\d{1,2})\s*$', text.strip())
+    hours_match = _HOURS_RE.search(text.strip())
     if hours_match:
-        nums = re.findall(r'\d{1,2}', hours_match.group(1))
+        nums = _NUM_RE.findall(hours_match.group(1))
         hours = [int(h) for h in nums if 0 <= int(h) <= 23]
         if hours:
             result["review_hours"] = sorted(set(hours))
@@ -792,11 +1037,9 @@ def parse_schedule_text(text: str):
 
 async def schedule_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /schedule command - view or update review schedule."""
-    global review_config
-
     logger.info(f"/schedule from user {update.effective_user.id}")
 
-    if str(update.effective_user.id) != REVIEW_USER_ID:
+    if update.effective_user.id != REVIEW_USER_ID_INT:
         await update.message.reply_text("Sorry, this bot is private.")
         return
 
@@ -808,7 +1051,7 @@ async def schedule_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
             await update.message.reply_text("Could not parse schedule. Try: /schedule 20 words at 8 13 17 19 22")
             return
         review_config.update(parsed)
-        save_config(review_config)
+        schedule_config_save()
         if scheduler:
             apply_schedule(scheduler, review_config)
         next_run = get_next_review_time()
@@ -822,87 +1065,112 @@ async def schedule_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     await send_schedule_display(update.message, review_config)
 
 
-async def handle_schedule_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Handle schedule-related callback buttons."""
-    global review_config
+async def _sched_edit_times(query, data: str) -> None:
+    await query.answer("Tap hours to toggle on/off, then press Done", show_alert=True)
+    await query.edit_message_text(
+        text="Select review hours (tap to toggle):",
+        reply_markup=build_hour_grid(tuple(sorted(review_config["review_hours"])))
+    )
 
-    query = update.callback_query
 
-    if str(query.from_user.id) != REVIEW_USER_ID:
-        await query.answer()
-        return
+async def _sched_toggle_hour(query, data: str) -> None:
+    await query.answer()
+    hour = int(data.split("_")[-1])
+    hours = review_config["review_hours"]
+    if hour in hours:
+        if len(hours) > 1:  # Keep at least one hour
+            hours.remove(hour)
+    else:
+        hours.append(hour)
+        hours.sort()
+    review_config["review_hours"] = hours
+    await query.edit_message_reply_markup(reply_markup=build_hour_grid(tuple(sorted(hours))))
 
-    data = query.data
 
-    if data == "sched_edit_times":
-        await query.answer("Tap hours to toggle on/off, then press Done", show_alert=True)
-        await query.edit_message_text(
-            text="Select review hours (tap to toggle):",
-            reply_markup=build_hour_grid(review_config["review_hours"])
-        )
+async def _sched_done_times(query, data: str) -> None:
+    await query.answer()
+    schedule_config_save()
+    if scheduler:
+        apply_schedule(scheduler, review_config)
+    await send_schedule_display(query, review_config, edit=True)
 
-    elif data.startswith("sched_toggle_"):
-        await query.answer()
-        hour = int(data.split("_")[-1])
-        hours = review_config["review_hours"]
-        if hour in hours:
-            if len(hours) > 1:  # Keep at least one hour
-                hours.remove(hour)
-        else:
-            hours.append(hour)
-            hours.sort()
-        review_config["review_hours"] = hours
-        await query.edit_message_reply_markup(reply_markup=build_hour_grid(hours))
 
-    elif data == "sched_done_times":
-        await query.answer()
-        save_config(review_config)
-        if scheduler:
-            apply_schedule(scheduler, review_config)
-        await send_schedule_display(query, review_config, edit=True)
+async def _sched_edit_words(query, data: str) -> None:
+    await query.answer("Tap to select words per batch", show_alert=True)
+    await query.edit_message_text(
+        text="Select words per batch:",
+        reply_markup=build_word_options(review_config["words_per_batch"])
+    )
 
-    elif data == "sched_edit_words":
-        await query.answer("Tap to select words per batch", show_alert=True)
-        await query.edit_message_text(
-            text="Select words per batch:",
-            reply_markup=build_word_options(review_config["words_per_batch"])
-        )
 
-    elif data.startswith("sched_words_"):
-        await query.answer()
-        n = int(data.split("_")[-1])
-        review_config["words_per_batch"] = n
-        save_config(review_config)
-        await send_schedule_display(query, review_config, edit=True)
-
-    elif data == "sched_edit_voice":
-        await query.answer("Tap voices to toggle on/off, then press Done", show_alert=True)
-        await query.edit_message_text(
-            text="Select TTS voices (tap to toggle, multi-select):",
-            reply_markup=build_voice_options(review_config.get("tts_voices", ["en-GB-SoniaNeural"]))
-        )
+async def _sched_set_words(query, data: str) -> None:
+    await query.answer()
+    n = int(data.split("_")[-1])
+    review_config["words_per_batch"] = n
+    schedule_config_save()
+    await send_schedule_display(query, review_config, edit=True)
 
-    elif data.startswith("sched_voice_toggle_"):
-        await query.answer()
-        voice_id = data[len("sched_voice_toggle_"):]
-        voices = review_config.get("tts_voices", ["en-GB-SoniaNeural"])
-        if voice_id in voices:
-            if len(voices) > 1:  # Keep at least one voice
-                voices.remove(voice_id)
-        else:
-            if voice_id in TTS_VOICES:
-                voices.append(voice_id)
-        review_config["tts_voices"] = voices
-        await query.edit_message_reply_markup(reply_markup=build_voice_options(voices))
 
-    elif data == "sched_done_voices":
-        await query.answer()
-        save_config(review_config)
-        await send_schedule_display(query, review_config, edit=True)
+async def _sched_edit_voice(query, data: str) -> None:
+    await query.answer("Tap voices to toggle on/off, then press Done", show_alert=True)
+    await query.edit_message_text(
+        text="Select TTS voices (tap to toggle, multi-select):",
+        reply_markup=build_voice_options(review_config.get("tts_voices", ["en-GB-SoniaNeural"]))
+    )
+
+
+async def _sched_toggle_voice(query, data: str) -> None:
+    await query.answer()
+    voice_id = data[len("sched_voice_toggle_"):]
+    voices = review_config.get("tts_voices", ["en-GB-SoniaNeural"])
+    if voice_id in voices:
+        if len(voices) > 1:  # Keep at least one voice
+            voices.remove(voice_id)
+    else:
+        if voice_id in TTS_VOICES:
+            voices.append(voice_id)
+    review_config["tts_voices"] = voices
+    await query.edit_message_reply_markup(reply_markup=build_voice_options(voices))
+
+
+async def _sched_done_voices(query, data: str) -> None:
+    await query.answer()
+    schedule_config_save()
+    await send_schedule_display(query, review_config, edit=True)
+
+
+async def _sched_back(query, data: str) -> None:
+    await query.answer()
+    await send_schedule_display(query, review_config, edit=True)
+
+
+# Schedule callback data → handler. Parameterized buttons ("sched_toggle_8",
+# "sched_voice_toggle_<voice>") are keyed by everything before the last "_"
+_SCHED_HANDLERS = {
+    "sched_edit_times": _sched_edit_times,
+    "sched_toggle": _sched_toggle_hour,
+    "sched_done_times": _sched_done_times,
+    "sched_edit_words": _sched_edit_words,
+    "sched_words": _sched_set_words,
+    "sched_edit_voice": _sched_edit_voice,
+    "sched_voice_toggle": _sched_toggle_voice,
+    "sched_done_voices": _sched_done_voices,
+    "sched_back": _sched_back,
+}
 
-    elif data == "sched_back":
+
+async def handle_schedule_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handle schedule-related callback buttons."""
+    query = update.callback_query
+
+    if query.from_user.id != REVIEW_USER_ID_INT:
         await query.answer()
-        await send_schedule_display(query, review_config, edit=True)
+        return
+
+    data = query.data
+    handler = _SCHED_HANDLERS.get(data) or _SCHED_HANDLERS.get(data.rsplit("_", 1)[0])
+    if handler:
+        await handler(query, data)
 
 
 def _unspoiler_html(message) -> str:
@@ -913,55 +1181,171 @@ def _unspoiler_html(message) -> str:
     return text
 
 
+def _now_utc() -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+def _now_local() -> datetime.datetime:
+    """Aware current time in TIMEZONE (the scheduler's clock), not the host's."""
+    return datetime.datetime.now(pytz.timezone(TIMEZONE))
+
+
+def _local_today() -> datetime.date:
+    return _now_local().date()
+
+
+def _start_prefetch(batch_size: int, sent_ids=()) -> None:
+    """Fetch the next review batch in the background (see _take_prefetch).
+
+    sent_ids are the cards just sent; they are still due until rated, so
+    they are excluded rather than picked again for the next batch.
+    """
+    global _prefetch
+    task = _spawn(asyncio.to_thread(
+        notion_handler.fetch_entries_for_review, batch_size, smart=True, exclude_ids=sent_ids
+    ))
+    _prefetch = (time.monotonic(), _local_today(), batch_size, task)
+
+
+async def _take_prefetch(batch_size: int):
+    """Return the prefetched batch if it is still valid, else None.
+
+    Valid means same batch size and day, younger than PREFETCH_MAX_AGE, and
+    no card rated since (a rating changes which words are due).
+    """
+    global _prefetch
+    prefetch, _prefetch = _prefetch, None
+    if prefetch is None:
+        return None
+    ts, day, size, task = prefetch
+    if size != batch_size or day != _local_today() or time.monotonic() - ts > PREFETCH_MAX_AGE:
+        return None
+    entries = await task
+    if entries:
+        logger.info(f"Using {len(entries)} prefetched review entries")
+    return entries or None
+
+
+def queue_rating(page_id: str, response: str, review_count) -> asyncio.Future:
+    """Queue a rating for the next bulk write after RATING_FLUSH_DELAY, coalescing taps.
+
+    The returned future resolves to the card's update_review_stats() result.
+    """
+    global _ratings_task
+    future = asyncio.get_running_loop().create_future()
+    _pending_ratings.append((page_id, response, review_count, future))
+    if _ratings_task is None or _ratings_task.done():
+        _ratings_task = asyncio.create_task(_ratings_writer())
+    return future
+
+
+async def _ratings_writer() -> None:
+    """Write queued ratings until none arrived during the last write window."""
+    while _pending_ratings:
+        await asyncio.sleep(RATING_FLUSH_DELAY)
+        await flush_ratings()
+
+
+async def flush_ratings() -> None:
+    """Write every queued rating now and resolve their futures."""
+    batch = _pending_ratings[:]
+    _pending_ratings.clear()
+    if not batch:
+        return
+    try:
+        results = await asyncio.to_thread(_persist_reviews, [item[:3] for item in batch])
+    except Exception as e:
+        logger.error(f"Writing {len(batch)} ratings failed: {e}")
+        results = [{"success": False, "error": str(e)}] * len(batch)
+    for (*_, future), result in zip(batch, results):
+        if not future.done():
+            future.set_result(result)
+
+
+def _persist_reviews(updates: list) -> list:
+    """Write ratings to Notion and the daily stats DB (blocking; run in a thread)."""
+    results = notion_handler.update_review_stats_bulk(updates)
+    _cache.clear()
+    if stats_handler:
+        stats_handler.record_reviews([response for _, response, _ in updates])
+    return results
+
+
+def _on_background_done(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception():
+        logger.error(f"Background task failed: {task.exception()}")
+
+
+def _spawn(coro) -> asyncio.Task:
+    """Start coro as a task, keeping a reference until it finishes and logging failures."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_done)
+    return task
+
+
 async def handle_review_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle Again/Good/Easy button presses."""
     query = update.callback_query
-    await query.answer()
 
-    if str(query.from_user.id) != REVIEW_USER_ID:
+    if query.from_user.id != REVIEW_USER_ID_INT:
+        await query.answer()
+        return
+
+    # Old cards (pending ones get resent as new messages) would write a stale
+    # rating over a newer schedule; retire their buttons instead
+    if query.message is None or _now_utc() - query.message.date > CARD_RATING_WINDOW:
+        await query.answer("This card has expired. Tap 📋 Pending for fresh ones.", show_alert=True)
+        await query.edit_message_reply_markup(reply_markup=None)
         return
+    await query.answer()
 
     data = query.data
+    response, _, page_id = data.partition("_")
+    if response not in ("again", "good", "easy"):
+        return
 
-    if data.startswith("again_"):
-        page_id = data[6:]  # Remove "again_" prefix
-        cached = sent_but_unrated.pop(page_id, None)
-        review_count = cached["entry"].get("review_count", 0) if cached else None
-        result = notion_handler.update_review_stats(page_id, response="again", current_review_count=review_count)
-        if stats_handler:
-            stats_handler.record_review("again")
+    global _prefetch
+    _prefetch = None  # picked before this rating, so possibly no longer the right words
+    cached = sent_but_unrated.pop(page_id, None)
+    review_count = cached["entry"].get("review_count", 0) if cached else None
+    # Persist in the background so the card is revealed without waiting on Notion
+    result_future = queue_rating(page_id, response, review_count)
+    # Grouped message: drop this card's row, and reveal answers only once every card is rated
+    rows = query.message.reply_markup.inline_keyboard if query.message.reply_markup else ()
+    remaining = [row for row in rows if row[0].callback_data.partition("_")[2] != page_id]
+    if remaining:
+        await query.edit_message_reply_markup(reply_markup=InlineKeyboardMarkup(remaining))
+    else:
         revealed = _unspoiler_html(query.message)
         await query.edit_message_text(text=revealed, parse_mode="HTML", reply_markup=None)
 
-    elif data.startswith("good_"):
-        page_id = data[5:]  # Remove "good_" prefix
-        cached = sent_but_unrated.pop(page_id, None)
-        review_count = cached["entry"].get("review_count", 0) if cached else None
-        result = notion_handler.update_review_stats(page_id, response="good", current_review_count=review_count)
-        if stats_handler:
-            stats_handler.record_review("good")
-        revealed = _unspoiler_html(query.message)
-        await query.edit_message_text(text=revealed, parse_mode="HTML", reply_markup=None)
-        if result.get("mastered"):
-            word = query.message.text.split("\n")[2].strip() if query.message.text else ""
-            await query.message.reply_text(f"🎓 Mastered: {word}")
-
-    elif data.startswith("easy_"):
-        page_id = data[5:]  # Remove "easy_" prefix
-        cached = sent_but_unrated.pop(page_id, None)
-        review_count = cached["entry"].get("review_count", 0) if cached else None
-        result = notion_handler.update_review_stats(page_id, response="easy", current_review_count=review_count)
-        if stats_handler:
-            stats_handler.record_review("easy")
-        revealed = _unspoiler_html(query.message)
-        await query.edit_message_text(text=revealed, parse_mode="HTML", reply_markup=None)
-        if result.get("mastered"):
-            word = query.message.text.split("\n")[2].strip() if query.message.text else ""
-            await query.message.reply_text(f"🎓 Mastered: {word}")
+    if response != "again":
+        # The word comes from the card's record; only a one-card message can
+        # fall back to its text, since a grouped one starts with another card
+        grouped = bool(rows) and not rows[0][0].text.endswith("Again")  # numbered rows, see _rating_row
+        if cached:
+            word = cached["entry"].get("english", "")
+        elif not grouped and query.message.text:
+            word = query.message.text.split("\n")[2].strip()
+        else:
+            word = ""
+        # Not awaited here: updates are handled one at a time, so waiting out
+        # RATING_FLUSH_DELAY would hold back the next tap and defeat the batching
+        _spawn(_announce_if_mastered(result_future, query.message, word))
+
+
+async def _announce_if_mastered(result_future: asyncio.Future, message, word: str) -> None:
+    """Reply under the card once its queued rating is written, if it made the word mastered."""
+    result = await result_future
+    if result.get("mastered"):
+        await message.reply_text(f"🎓 Mastered: {word}" if word else "🎓 Word mastered")
+
 
 async def handle_keyboard_button(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle taps on the persistent reply keyboard buttons."""
-    if str(update.effective_user.id) != REVIEW_USER_ID:
+    if update.effective_user.id != REVIEW_USER_ID_INT:
         return
     text = update.message.text.strip()
     if text == "📖 Review":
@@ -976,31 +1360,31 @@ async def handle_keyboard_button(update: Update, context: ContextTypes.DEFAULT_T
 
 
 def apply_schedule(sched, config: dict) -> None:
-    """Apply review schedule from config, removing old review jobs first."""
-    # Remove existing review jobs
-    for job in sched.get_jobs():
-        if job.id.startswith("review_"):
-            sched.remove_job(job.id)
-
-    # Add new jobs from config
-    for hour in config["review_hours"]:
-        job_id = f"review_{hour:02d}"
-        sched.add_job(
-            send_review_batch,
-            CronTrigger(hour=hour, minute=0, timezone=TIMEZONE),
-            id=job_id,
-            name=f"Review ({hour:02d}:00)"
-        )
+    """Apply review schedule from config, replacing the previous review job."""
+    global _review_job
+    if _review_job is not None:
+        sched.remove_job(_review_job.id)
+
+    # One job for all review hours, so the scheduler evaluates a single trigger
+    hours = config["review_hours"]
+    hours_str = ", ".join(f"{h:02d}:00" for h in hours)
+    _review_job = sched.add_job(
+        send_review_batch,
+        CronTrigger(hour=",".join(str(h) for h in hours), minute=0, timezone=TIMEZONE),
+        id="review_batches",
+        name=f"Review ({hours_str})",
+        # A batch missed by up to 10 min (restart, sleep) still runs, once
+        misfire_grace_time=600,
+        coalesce=True,
+        max_instances=1,
+    )
 
-    hours_str = ", ".join(f"{h:02d}:00" for h in config["review_hours"])
     logger.info(f"Schedule applied: {hours_str}, {config['words_per_batch']} words per batch")
 
-    # Log next run times for debugging
-    for job in sched.get_jobs():
-        if job.id.startswith("review_"):
-            next_time = getattr(job, 'next_run_time', None)
-            if next_time:
-                logger.info(f"Job '{job.name}' next run: {next_time}")
+    # Log next run time for debugging
+    next_time = getattr(_review_job, 'next_run_time', None)
+    if next_time:
+        logger.info(f"Job '{_review_job.name}' next run: {next_time}")
 
 
 async def daily_obsidian_stats_sync():
@@ -1022,10 +1406,18 @@ async def daily_obsidian_stats_sync():
 
 
 async def post_init(app: Application) -> None:
-    """Initialize scheduler after application starts."""
-    global scheduler
+    """Initialize scheduler and outbound sender worker after application starts."""
+    global scheduler, outbound_queue, _sender_task, _job_count
 
-    scheduler = AsyncIOScheduler(timezone=TIMEZONE, misfire_grace_time=120)
+    outbound_queue = asyncio.Queue()
+    _sender_task = asyncio.create_task(_sender_worker())
+
+    # Job defaults must go through job_defaults; a bare misfire_grace_time
+    # kwarg is ignored by APScheduler (leaving its 1s default)
+    scheduler = AsyncIOScheduler(
+        timezone=TIMEZONE,
+        job_defaults={"misfire_grace_time": 120, "coalesce": True, "max_instances": 1},
+    )
     apply_schedule(scheduler, review_config)
     scheduler.start()
 
@@ -1065,21 +1457,49 @@ async def post_init(app: Application) -> None:
     logger.info(f"Scheduler started with timezone {TIMEZONE}")
 
     # Log next run times for debugging
-    for job in scheduler.get_jobs():
+    jobs = scheduler.get_jobs()
+    _job_count = len(jobs)
+    for job in jobs:
         next_run = getattr(job, 'next_run_time', None)
         if next_run:
             logger.info(f"Job '{job.name}' next run: {next_run}")
 
 
+async def post_shutdown(app: Application) -> None:
+    """Flush queued messages, ratings and config edits, stop the sender worker and close the Notion pool."""
+    if outbound_queue is not None:
+        try:
+            await asyncio.wait_for(outbound_queue.join(), timeout=10)
+        except asyncio.TimeoutError:
+            logger.warning(f"Shutting down with {outbound_queue.qsize()} unsent messages")
+    if _sender_task:
+        _sender_task.cancel()
+        await asyncio.gather(_sender_task, return_exceptions=True)
+    # Not cancelled: a write in progress would be cut off from its futures
+    await flush_ratings()
+    if _ratings_task:
+        await asyncio.gather(_ratings_task, return_exceptions=True)
+    if _config_save_task and not _config_save_task.done():
+        _config_save_task.cancel()
+        await asyncio.gather(_config_save_task, return_exceptions=True)
+    if _config_dirty:
+        await _persist_config(dict(review_config))
+    if notion_handler:
+        notion_handler.close()
+
+
 async def error_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle errors."""
-    logger.error(f"Update {update} caused error {context.error}")
+    # Lazy args: repr(update) is large and only worth building if the record is emitted
+    logger.error("Update %s caused error %s", update, context.error)
 
 
 def main():
     """Main function to run the review bot."""
     global notion_handler, config_handler, application, review_config, is_paused, stats_handler
 
+    _start_log_listener()
+
     # Validate configuration
     if not REVIEW_BOT_TOKEN:
         print("ERROR: REVIEW_BOT_TOKEN not set in .env file")
@@ -1091,6 +1511,10 @@ def main():
         print("ERROR: NOTION_API_KEY not set in .env file")
         return
 
+    # Imported here so a misconfigured start fails before loading the Notion client stack
+    from shared.notion_handler import NotionHandler
+    from review.review_stats_handler import ReviewStatsHandler
+
     # Initialize Notion handler with additional databases for review
     notion_handler = NotionHandler(NOTION_KEY, NOTION_DB_ID, additional_database_ids=ADDITIONAL_DB_IDS)
 
@@ -1122,8 +1546,32 @@ def main():
     is_paused = review_config.get("is_paused", False)
     print(f"Config loaded: hours={review_config['review_hours']}, words={review_config['words_per_batch']}, voices={review_config.get('tts_voices', ['en-GB-SoniaNeural'])}, paused={is_paused}")
 
+    # uvloop's libuv loop cuts per-await overhead; run_polling/run_webhook create
+    # their loop from the policy. Optional (no Windows wheels), like orjson.
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        pass
+
     # Create application
-    application = Application.builder().token(REVIEW_BOT_TOKEN).post_init(post_init).build()
+    application = (
+        Application.builder()
+        .token(REVIEW_BOT_TOKEN)
+        .post_init(post_init)
+        .post_shutdown(post_shutdown)
+        # Bot API calls keep PTB's default 256-connection keep-alive pool; wait
+        # longer for a free connection and for slow replies (audio uploads)
+        .pool_timeout(10.0)
+        .read_timeout(30.0)
+        .rate_limiter(AIORateLimiter(
+            overall_max_rate=28, overall_time_period=1,
+            group_max_rate=18, group_time_period=60,
+            max_retries=3,  # wait out RetryAfter and resend instead of failing the card
+        ))
+        .build()
+    )
 
     # Add handlers
     application.add_handler(CommandHandler("start", start))
@@ -1145,11 +1593,24 @@ def main():
     # Add error handler
     application.add_error_handler(error_handler)
 
-    # Start polling (drop pending updates to avoid processing old queued commands)
+    # Start receiving updates (drop pending updates to avoid processing old queued commands)
     print(f"Review bot starting with timezone {TIMEZONE}...")
     print(format_schedule_text(review_config))
     print("Press Ctrl+C to stop")
-    application.run_polling(allowed_updates=Update.ALL_TYPES, drop_pending_updates=True)
+    if REVIEW_WEBHOOK_URL and REVIEW_WEBHOOK_PORT:
+        # Telegram pushes updates; run_webhook also registers the webhook.
+        # The token doubles as an unguessable URL path.
+        print(f"Webhook mode on port {REVIEW_WEBHOOK_PORT}")
+        application.run_webhook(
+            listen="0.0.0.0",
+            port=int(REVIEW_WEBHOOK_PORT),
+            url_path=REVIEW_BOT_TOKEN,
+            webhook_url=f"{REVIEW_WEBHOOK_URL}/{REVIEW_BOT_TOKEN}",
+            allowed_updates=Update.ALL_TYPES,
+            drop_pending_updates=True,
+        )
+    else:
+        application.run_polling(allowed_updates=Update.ALL_TYPES, drop_pending_updates=True)
 
 
 if __name__ == "__main__":
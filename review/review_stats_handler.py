@@ -59,6 +59,19 @@ class ReviewStatsHandler:
         Returns:
             True if successful
         """
+        return self.record_reviews([response])
+
+    def record_reviews(self, responses: list) -> bool:
+        """Increment today's counters for several responses with one read and one write.
+
+        Args:
+            responses: list of "again", "good", or "easy"
+
+        Returns:
+            True if successful
+        """
+        if not responses:
+            return True
         from datetime import datetime
         import zoneinfo
         today_str = datetime.now(zoneinfo.ZoneInfo(self.timezone)).date().isoformat()
@@ -69,8 +82,9 @@ class ReviewStatsHandler:
         else:
             counts = {"reviewed": 0, "again": 0, "good": 0, "easy": 0}
 
-        counts["reviewed"] += 1
-        counts[response] = counts.get(response, 0) + 1
+        counts["reviewed"] += len(responses)
+        for response in responses:
+            counts[response] = counts.get(response, 0) + 1
 
         try:
             props = {
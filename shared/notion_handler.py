@@ -3,11 +3,20 @@ Notion Handler - Saves vocabulary entries to Notion database
 """
 import re
 import random
+import heapq
+import unicodedata
+import asyncio
 import logging
+import itertools
+import threading
 import time
 import json
-from datetime import datetime, date, timedelta
+from collections import OrderedDict
+from functools import lru_cache, partial
+from datetime import date, timedelta
+from email.utils import parsedate_to_datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import httpx
 from notion_client import Client
 
 logger = logging.getLogger(__name__)
@@ -15,6 +24,358 @@ logger = logging.getLogger(__name__)
 # Words with review_count >= this are auto-marked as Mastered
 MASTERY_THRESHOLD = 7
 
+# Max concurrent pages.create calls when flushing queued entries
+SAVE_CONCURRENCY = 3
+
+# Max concurrent pages.update calls in update_review_stats_bulk()
+REVIEW_UPDATE_WORKERS = 8
+
+# Seconds before a cached database schema (and the category options read from it) is refreshed
+SCHEMA_TTL = 600
+
+# Seconds a full parsed-entry snapshot is reused by stats and review fetches
+ENTRIES_CACHE_TTL = 60.0
+
+# Seconds the candidate pool from a tiered review fetch is reused for the next pick
+CANDIDATES_CACHE_TTL = 30.0
+
+# A page's review count/database seen on fetch is trusted this long by update_review_stats
+# (same lifetime as the snapshot it came from); older counts are re-read from Notion
+PAGE_META_TTL = ENTRIES_CACHE_TTL
+# Max pages remembered that way; the least recently seen are dropped first
+PAGE_META_MAX = 4096
+
+# Notion allows ~3 requests/second per integration; requests are paced to this
+NOTION_RATE_LIMIT = 3.0
+
+# Keep-alive pool shared by every request a handler makes (paginate, parse, update)
+HTTP_MAX_CONNECTIONS = 32
+HTTP_MAX_KEEPALIVE = 16
+# Transport-level retries (connection failures only; 429/5xx are retried per request)
+HTTP_TRANSPORT_RETRIES = 3
+
+
+def _normalize_name(name: str) -> str:
+    """NFKC-normalize and casefold a property name or keyword.
+
+    Makes matching robust to fullwidth letters ("Ｃhinese") and other
+    compatibility forms that .lower() alone would miss.
+    """
+    return unicodedata.normalize("NFKC", name).casefold()
+
+
+_IPA_RE = re.compile(r'/[^/]+/')  # /IPA/ transcription
+_POS_RE = re.compile(r'\([^)]*\)')  # (pos.) part-of-speech marker
+
+
+def _strip_annotations(text: str) -> str:
+    """Remove /IPA/ and (pos.) annotations from an English word/phrase."""
+    return _POS_RE.sub('', _IPA_RE.sub('', text).strip()).strip()
+
+
+# Suffixes stripped by _lemmatize_word -> stem fix-up. "double" undoes
+# consonant doubling (running -> run), "y" restores a -y stem
+# (carried -> carry), "" leaves the stem as is.
+_SUFFIX_BY_TAIL = {
+    'ying': '',
+    'ing': 'double',
+    'ied': 'y',
+    'ies': 'y',
+    'ed': 'double',
+    'es': '',
+    's': '',
+}
+
+
+@lru_cache(maxsize=4096)
+def _lemmatize_word(word: str) -> str:
+    """Lemmatize a single word by removing common suffixes."""
+    word = word.lower()
+    # Longer suffixes first: probe the last 4, 3, 2, then 1 characters
+    for n in (4, 3, 2, 1):
+        fixup = _SUFFIX_BY_TAIL.get(word[-n:])
+        if fixup is None or len(word) <= n + 2:
+            continue
+        stem = word[:-n]
+        if fixup == 'double' and len(stem) >= 2 and stem[-1] == stem[-2]:
+            stem = stem[:-1]
+        elif fixup == 'y':
+            stem = stem + 'y'
+        return stem
+    return word
+
+
+@lru_cache(maxsize=4096)
+def _get_base_phrase(text: str) -> str:
+    """Extract base phrase from text, lemmatizing each word."""
+    # Remove /IPA/ and (pos.)
+    base = _strip_annotations(text).lower()
+
+    # Strip punctuation from each word
+    words = [w.strip('.!?,;:…"\'') for w in base.split()]
+    words = [w for w in words if w]  # Remove empty strings
+
+    # Lemmatize each word in the phrase
+    lemmatized = [_lemmatize_word(w) for w in words]
+    return ' '.join(lemmatized)
+
+
+def _title_search_tokens(text: str) -> list:
+    """Lemmatized tokens to AND together in a Notion title "contains" search.
+
+    Each token must be a substring of every inflected form, so a trailing
+    -y is dropped (carry -> "carr" also finds "carried"/"carries"), as is a
+    leading dictionary-form "be". One-letter tokens are skipped.
+    """
+    tokens = [t[:-1] if t.endswith('y') and len(t) > 3 else t for t in _get_base_phrase(text).split()]
+    if len(tokens) >= 3 and tokens[0] == 'be':
+        tokens = tokens[1:]
+    return [t for t in tokens if len(t) >= 2]
+
+
+# Keywords used to map database property names to entry fields when
+# auto-detecting the schema. Normalized once at import time.
+_FIELD_KEYWORDS = {
+    field: tuple(_normalize_name(kw) for kw in keywords)
+    for field, keywords in {
+        "english": ["english", "word", "phrase", "vocabulary", "title", "name"],
+        "chinese": ["chinese", "中文", "translation", "meaning"],
+        "explanation": ["explanation", "解释", "definition", "note", "notes"],
+        "example": ["example", "例句", "sentence", "usage"],
+        "category": ["category", "类别", "type", "tag"],
+        "date": ["date", "日期", "created", "added"],
+        "from": ["from", "source", "来源"],
+    }.items()
+}
+
+
+class _TokenBucket:
+    """Thread-safe token bucket: acquire() blocks until a request may be sent."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def _build_http_client(rate_limiter: _TokenBucket = None) -> httpx.Client:
+    """Pooled httpx client for the Notion SDK, reused across all its requests.
+
+    If orjson is installed, Notion responses are decoded with it instead of
+    the stdlib json module (only for this client, not httpx globally).
+
+    Args:
+        rate_limiter: If given, every outgoing request first takes a token from it
+    """
+    event_hooks = {}
+    if rate_limiter is not None:
+        event_hooks["request"] = [lambda request: rate_limiter.acquire()]
+    try:
+        import orjson
+
+        def _use_orjson(response: httpx.Response) -> None:
+            response.json = lambda **kwargs: orjson.loads(response.content)
+
+        event_hooks["response"] = [_use_orjson]
+    except ImportError:
+        pass
+
+    return httpx.Client(
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+        ),
+        transport=httpx.HTTPTransport(retries=HTTP_TRANSPORT_RETRIES),
+        event_hooks=event_hooks,
+    )
+
+
+def _parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date), or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """Seconds to sleep before retrying after `error` on attempt `attempt` (0-based).
+
+    Honors Retry-After on 429 responses; otherwise exponential backoff capped
+    at 60s. Both get jitter so concurrent sessions don't retry in lockstep.
+    """
+    if getattr(error, "status", None) == 429:
+        headers = getattr(error, "headers", None) or {}
+        retry_after = _parse_retry_after(headers.get("retry-after"))
+        if retry_after is not None:
+            return retry_after + random.uniform(0, 0.5)
+    return min(60, 2 ** (attempt + 1)) + random.uniform(0, 1)
+
+
+def _safe_parse_date(value):
+    """Parse a YYYY-MM-DD string into a date, or None if missing/invalid."""
+    try:
+        return date.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _rich_text(content: str) -> dict:
+    return {"rich_text": [{"text": {"content": content}}]}
+
+
+def _build_entry_properties(entry: dict, include_meta: bool = True) -> dict:
+    """Build the fixed-shape property payload for a vocabulary entry.
+
+    The shape never changes between saves (only leaf strings do), so it is
+    built in one literal instead of being assembled field by field.
+
+    Args:
+        entry: Entry dict (english, chinese, explanation, example_en, example_zh, category, date)
+        include_meta: Also set Date and From (creation only; updates keep the originals)
+    """
+    properties = {
+        "English": {"title": [{"text": {"content": entry.get("english", "")}}]},
+        "Chinese": _rich_text(entry.get("chinese", "")),
+        "Explanation": _rich_text(entry.get("explanation", "")),
+        "Example": _rich_text(f"{entry.get('example_en', '')}\n{entry.get('example_zh', '')}"),
+        "Category": {"select": {"name": entry.get("category", "其他")}},
+    }
+    if include_meta:
+        properties["Date"] = {"date": {"start": entry.get("date", "")}}
+        properties["From"] = _rich_text("From Claude")
+    return properties
+
+
+def _entry_content_fields(entry: dict) -> dict:
+    """Content fields of an entry as _parse_page_to_entry_static would read them back."""
+    return {
+        "english": entry.get("english", ""),
+        "chinese": entry.get("chinese", ""),
+        "explanation": entry.get("explanation", ""),
+        "example": f"{entry.get('example_en', '')}\n{entry.get('example_zh', '')}",
+        "category": entry.get("category", "其他"),
+    }
+
+
+def _resolve_page_property(prop_name: str, prop_type: str):
+    """Map a page property to the entry field it fills, or None to skip it."""
+    norm = _normalize_name(prop_name)
+    if prop_type == "title":
+        return "english"
+    if prop_type == "rich_text":
+        if "chinese" in norm or "中文" in norm:
+            return "chinese"
+        if "explanation" in norm or "解释" in norm:
+            return "explanation"
+        if "example" in norm or "例句" in norm:
+            return "example"
+    elif prop_type == "select":
+        if "category" in norm or "类别" in norm:
+            return "category"
+    elif prop_type == "date":
+        if "next" in norm and "review" in norm:
+            return "next_review"
+        if "last" in norm and "review" in norm:
+            return "last_reviewed"
+        if norm == "date" or "added" in norm:
+            return "date"
+    elif prop_type == "number":
+        if "review" in norm and "count" in norm:
+            return "review_count"
+    elif prop_type == "checkbox":
+        if "master" in norm:
+            return "mastered"
+    return None
+
+
+def _parse_page_to_entry_static(page: dict, resolvers: dict) -> dict:
+    """Parse a Notion page into an entry dictionary, or None for config/invalid pages.
+
+    Args:
+        page: Notion page object
+        resolvers: database id -> {property name: entry field or None};
+            filled in on miss, so each property is classified once per database
+    """
+    try:
+        properties = page.get("properties", {})
+        entry = {
+            "page_id": page.get("id")  # Store page ID for updates
+        }
+        db_id = (page.get("parent") or {}).get("database_id")
+        resolver = resolvers.get(db_id)
+        if resolver is None:
+            resolver = resolvers[db_id] = {}
+
+        for prop_name, prop_value in properties.items():
+            if prop_name in resolver:
+                field = resolver[prop_name]
+            else:
+                field = resolver[prop_name] = _resolve_page_property(prop_name, prop_value.get("type"))
+            if field is None:
+                continue
+
+            # Title property (English word)
+            if field == "english":
+                title_content = prop_value.get("title", [])
+                if title_content:
+                    title_text = title_content[0].get("plain_text", "")
+                    # Skip config pages (used for bot settings persistence)
+                    if title_text.startswith("__CONFIG_"):
+                        return None
+                    entry["english"] = title_text
+
+            # Rich text properties
+            elif field in ("chinese", "explanation", "example"):
+                rich_text = prop_value.get("rich_text", [])
+                entry[field] = rich_text[0].get("plain_text", "") if rich_text else ""
+
+            # Select property (category)
+            elif field == "category":
+                select_value = prop_value.get("select")
+                if select_value:
+                    entry["category"] = select_value.get("name", "")
+
+            # Date properties
+            elif field in ("next_review", "last_reviewed", "date"):
+                date_value = prop_value.get("date")
+                if date_value:
+                    entry[field] = date_value.get("start", "")
+
+            # Number properties
+            elif field == "review_count":
+                entry["review_count"] = prop_value.get("number") or 0
+
+            # Checkbox properties
+            elif field == "mastered":
+                entry["mastered"] = prop_value.get("checkbox", False)
+
+        return entry if entry.get("english") else None
+
+    except Exception:
+        return None
+
 
 class NotionHandler:
     def __init__(self, api_key: str, database_id: str, additional_database_ids: list = None):
@@ -26,29 +387,124 @@ class NotionHandler:
             additional_database_ids: Optional list of additional database IDs for review
                                     (combined with primary database when fetching)
         """
-        self.client = Client(auth=api_key)
+        # Shared by every SDK call this handler makes (queries, retrieves,
+        # creates, updates), so parallel batches stay under Notion's limit
+        self._rate_limiter = _TokenBucket(rate=NOTION_RATE_LIMIT, capacity=NOTION_RATE_LIMIT)
+        self.client = Client(auth=api_key, client=_build_http_client(self._rate_limiter))
         self.database_id = database_id
-        self._category_options = None
+        self._category_options = None  # {"list": [...], "ts": monotonic}
+        self._db_schema_cache = {}  # db_id -> (databases.retrieve() result, monotonic ts)
+        self._prop_name_maps = {}  # db_id -> {canonical field: actual property name}
+        self._page_meta = OrderedDict()  # page_id -> (monotonic ts, review count, database id); see _recent_page_meta
+        self._prop_name_norm = {}  # property name -> NFKC-normalized, casefolded name
+        self._page_resolvers = {}  # db_id -> {page property name: entry field or None}
+        self._review_prop_names = {}  # db_id -> {entry field: page property name}
+        self._entries_cache = None  # Parsed entries from the last full scan
+        self._entries_cache_pages = None  # Raw pages of that scan, until first parsed
+        self._entries_index = {}  # page_id -> cached entry, for in-place updates
+        self._entries_lock = threading.RLock()
+        self._entries_cache_key = None  # tuple(all_database_ids) the cache was built for
+        self._entries_cache_ts = 0.0
+        self._entries_cache_ttl = ENTRIES_CACHE_TTL
+        self._candidates_cache = None  # (monotonic ts, date, count, entries) from the last tiered fetch
 
         # All database IDs for review (primary + additional)
         self.all_database_ids = [database_id]
         if additional_database_ids:
             self.all_database_ids.extend(additional_database_ids)
 
+    def _get_db_schema(self, db_id: str = None, max_age: float = None) -> dict:
+        """Return a database schema, retrieving it once per db_id.
+
+        Also normalizes every property name once and resolves the canonical
+        field -> property name map, so later lookups are plain dict access.
+
+        Args:
+            db_id: Database to describe (defaults to the primary database)
+            max_age: Re-retrieve if the cached schema is older than this many seconds
+        """
+        db_id = db_id or self.database_id
+        cached = self._db_schema_cache.get(db_id)
+        if cached is None or (max_age is not None and time.monotonic() - cached[1] > max_age):
+            db = self.client.databases.retrieve(database_id=db_id)
+            properties = db.get("properties", {})
+            self._prop_name_norm.update({name: _normalize_name(name) for name in properties})
+            self._prop_name_maps[db_id] = self._build_prop_name_map(properties)
+            cached = self._db_schema_cache[db_id] = (db, time.monotonic())
+        return cached[0]
+
+    def _build_prop_name_map(self, properties: dict) -> dict:
+        """Resolve canonical entry fields to the database's actual property names.
+
+        Runs the keyword scan once per schema; the first matching property wins.
+        """
+        name_map = {}
+        for prop_name, prop_config in properties.items():
+            prop_type = prop_config.get("type")
+            norm = self._norm_prop_name(prop_name)
+            field = None
+            if prop_type == "title":
+                field = "title"
+            elif prop_type == "rich_text":
+                for candidate in ("chinese", "explanation", "example", "from"):
+                    if any(kw in norm for kw in _FIELD_KEYWORDS[candidate]):
+                        field = candidate
+                        break
+            elif prop_type == "select":
+                if any(kw in norm for kw in _FIELD_KEYWORDS["category"]):
+                    field = "category"
+            elif prop_type == "date":
+                if "next" in norm and "review" in norm:
+                    field = "next_review"
+                elif "last" in norm and "review" in norm:
+                    field = "last_reviewed"
+                elif any(kw in norm for kw in _FIELD_KEYWORDS["date"]):
+                    field = "date"
+            elif prop_type == "number":
+                if "review" in norm and "count" in norm:
+                    field = "review_count"
+            elif prop_type == "checkbox":
+                if "master" in norm:
+                    field = "mastered"
+            if field and field not in name_map:
+                name_map[field] = prop_name
+        return name_map
+
+    def _get_prop_name_map(self, db_id: str = None) -> dict:
+        """Canonical field -> property name map for a database ({} if unavailable)."""
+        db_id = db_id or self.database_id
+        try:
+            self._get_db_schema(db_id, max_age=SCHEMA_TTL)
+        except Exception as e:
+            logger.warning(f"Schema lookup failed for {db_id}: {e}")
+        return self._prop_name_maps.get(db_id, {})
+
+    def _norm_prop_name(self, prop_name: str) -> str:
+        """Normalized property name, memoized (covers additional databases too)."""
+        normalized = self._prop_name_norm.get(prop_name)
+        if normalized is None:
+            normalized = self._prop_name_norm[prop_name] = _normalize_name(prop_name)
+        return normalized
+
     def get_category_options(self) -> list:
-        """Fetch existing category options from the database."""
-        if self._category_options is not None:
-            return self._category_options
+        """Fetch existing category options from the database.
+
+        Cached for SCHEMA_TTL seconds so options added in Notion
+        are picked up without a restart.
+        """
+        cached = self._category_options
+        if cached is not None and time.monotonic() - cached["ts"] <= SCHEMA_TTL:
+            return cached["list"]
 
         try:
-            db = self.client.databases.retrieve(database_id=self.database_id)
+            db = self._get_db_schema(max_age=SCHEMA_TTL)
             # Try to find category property
             properties = db.get("properties", {})
             for prop_name, prop_config in properties.items():
-                if prop_config.get("type") == "select" and "category" in prop_name.lower():
-                    options = prop_config.get("select", {}).get("options", [])
-                    self._category_options = [opt["name"] for opt in options]
-                    return self._category_options
+                if prop_config.get("type") == "select" and "category" in self._norm_prop_name(prop_name):
+                    options = [opt["name"] for opt in prop_config.get("select", {}).get("options", [])]
+                    self._category_options = {"list": options, "ts": time.monotonic()}
+                    return options
             return []
         except Exception:
             return []
@@ -68,70 +524,14 @@ class NotionHandler:
             "date": "2024-01-01"
         }
         """
-        # Build properties based on common Notion vocabulary database schema
-        properties = {
-            "English": {
-                "title": [
-                    {
-                        "text": {
-                            "content": entry.get("english", "")
-                        }
-                    }
-                ]
-            },
-            "Chinese": {
-                "rich_text": [
-                    {
-                        "text": {
-                            "content": entry.get("chinese", "")
-                        }
-                    }
-                ]
-            },
-            "Explanation": {
-                "rich_text": [
-                    {
-                        "text": {
-                            "content": entry.get("explanation", "")
-                        }
-                    }
-                ]
-            },
-            "Example": {
-                "rich_text": [
-                    {
-                        "text": {
-                            "content": f"{entry.get('example_en', '')}\n{entry.get('example_zh', '')}"
-                        }
-                    }
-                ]
-            },
-            "Category": {
-                "select": {
-                    "name": entry.get("category", "其他")
-                }
-            },
-            "Date": {
-                "date": {
-                    "start": entry.get("date", "")
-                }
-            },
-            "From": {
-                "rich_text": [
-                    {
-                        "text": {
-                            "content": "From Claude"
-                        }
-                    }
-                ]
-            }
-        }
+        properties = _build_entry_properties(entry)
 
         try:
             response = self.client.pages.create(
                 parent={"database_id": self.database_id},
                 properties=properties
             )
+            self._add_cached_entry(response["id"], entry)
             return {
                 "success": True,
                 "page_id": response["id"],
@@ -147,54 +547,62 @@ class NotionHandler:
                 "error": error_msg
             }
 
+    async def save_entries(self, entries: list) -> list:
+        """Save several entries concurrently (up to SAVE_CONCURRENCY at once).
+
+        Notion has no multi-page create endpoint, so entries are still one
+        pages.create each, but they overlap instead of running back to back.
+
+        Returns:
+            List of save_entry() results, in the order of entries
+        """
+        if not entries:
+            return []
+
+        semaphore = asyncio.Semaphore(SAVE_CONCURRENCY)
+
+        async def _save(entry: dict) -> dict:
+            async with semaphore:
+                return await asyncio.to_thread(self.save_entry, entry)
+
+        results = await asyncio.gather(*(_save(e) for e in entries))
+        for entry, result in zip(entries, results):
+            if not result["success"]:
+                logger.error(f"Save failed for '{entry.get('english', '')}': {result.get('error')}")
+        return results
+
     def update_entry_content(self, page_id: str, entry: dict) -> dict:
         """Update content fields of an existing entry, preserving review progress."""
-        properties = {
-            "English": {
-                "title": [{"text": {"content": entry.get("english", "")}}]
-            },
-            "Chinese": {
-                "rich_text": [{"text": {"content": entry.get("chinese", "")}}]
-            },
-            "Explanation": {
-                "rich_text": [{"text": {"content": entry.get("explanation", "")}}]
-            },
-            "Example": {
-                "rich_text": [{"text": {"content": f"{entry.get('example_en', '')}\n{entry.get('example_zh', '')}"}}]
-            },
-            "Category": {
-                "select": {"name": entry.get("category", "其他")}
-            },
-        }
+        properties = _build_entry_properties(entry, include_meta=False)
         # Does NOT touch: Review Count, Next Review, Last Reviewed, Mastered, Date
         try:
             response = self.client.pages.update(page_id=page_id, properties=properties)
+            self._update_cached_entry(page_id, _entry_content_fields(entry))
             return {"success": True, "page_id": response["id"]}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
     def _save_with_auto_detect(self, entry: dict) -> dict:
-        """Try to save by auto-detecting database schema."""
+        """Try to save by auto-detecting database schema.
+
+        Only reached after save_entry() failed, usually because the schema
+        changed, so the schema is re-read rather than taken from the cache.
+        Every matching property is filled, not just the first per field.
+        """
         try:
-            db = self.client.databases.retrieve(database_id=self.database_id)
-            db_properties = db.get("properties", {})
+            db = self._get_db_schema(max_age=0)
 
             properties = {}
-
-            # Map entry fields to database properties
-            field_mapping = {
-                "english": ["english", "word", "phrase", "vocabulary", "title", "name"],
-                "chinese": ["chinese", "中文", "translation", "meaning"],
-                "explanation": ["explanation", "解释", "definition", "note", "notes"],
-                "example": ["example", "例句", "sentence", "usage"],
-                "category": ["category", "类别", "type", "tag"],
-                "date": ["date", "日期", "created", "added"],
-                "from": ["from", "source", "来源"]
+            rich_text_values = {
+                "chinese": entry.get("chinese", ""),
+                "explanation": entry.get("explanation", ""),
+                "example": f"{entry.get('example_en', '')}\n{entry.get('example_zh', '')}",
+                "from": "From Claude",
             }
 
-            for db_prop_name, db_prop_config in db_properties.items():
+            for db_prop_name, db_prop_config in db.get("properties", {}).items():
                 prop_type = db_prop_config.get("type")
-                prop_name_lower = db_prop_name.lower()
+                norm = self._norm_prop_name(db_prop_name)
 
                 # Title property (usually English word)
                 if prop_type == "title":
@@ -202,33 +610,24 @@ class NotionHandler:
                         "title": [{"text": {"content": entry.get("english", "")}}]
                     }
 
-                # Rich text properties
+                # Rich text properties: first matching field decides the content
                 elif prop_type == "rich_text":
-                    content = ""
-                    if any(kw in prop_name_lower for kw in field_mapping["chinese"]):
-                        content = entry.get("chinese", "")
-                    elif any(kw in prop_name_lower for kw in field_mapping["explanation"]):
-                        content = entry.get("explanation", "")
-                    elif any(kw in prop_name_lower for kw in field_mapping["example"]):
-                        content = f"{entry.get('example_en', '')}\n{entry.get('example_zh', '')}"
-                    elif any(kw in prop_name_lower for kw in field_mapping["from"]):
-                        content = "From Claude"
-
-                    if content:
-                        properties[db_prop_name] = {
-                            "rich_text": [{"text": {"content": content}}]
-                        }
+                    for field, content in rich_text_values.items():
+                        if any(kw in norm for kw in _FIELD_KEYWORDS[field]):
+                            if content:
+                                properties[db_prop_name] = _rich_text(content)
+                            break
 
                 # Select property (category)
                 elif prop_type == "select":
-                    if any(kw in prop_name_lower for kw in field_mapping["category"]):
+                    if any(kw in norm for kw in _FIELD_KEYWORDS["category"]):
                         properties[db_prop_name] = {
                             "select": {"name": entry.get("category", "其他")}
                         }
 
                 # Date property
                 elif prop_type == "date":
-                    if any(kw in prop_name_lower for kw in field_mapping["date"]):
+                    if any(kw in norm for kw in _FIELD_KEYWORDS["date"]):
                         properties[db_prop_name] = {
                             "date": {"start": entry.get("date", "")}
                         }
@@ -237,6 +636,7 @@ class NotionHandler:
                 parent={"database_id": self.database_id},
                 properties=properties
             )
+            self._add_cached_entry(response["id"], entry)
             return {
                 "success": True,
                 "page_id": response["id"],
@@ -249,15 +649,20 @@ class NotionHandler:
                 "error": str(e)
             }
 
+    def close(self) -> None:
+        """Close the pooled HTTP connections to Notion."""
+        self.client.close()
+
     def test_connection(self) -> dict:
         """Test the Notion connection and return database info."""
         try:
-            db = self.client.databases.retrieve(database_id=self.database_id)
+            # Always hits the API (max_age=0) and leaves the schema cache warm for saves
+            db = self._get_db_schema(max_age=0)
             title = ""
             if db.get("title"):
                 title = db["title"][0].get("plain_text", "Untitled")
 
-            properties = list(db.get("properties", {}).keys())
+            properties = tuple(db.get("properties", {}))
 
             return {
                 "success": True,
@@ -410,41 +815,6 @@ class NotionHandler:
             logger.error(f"Error saving bot config '{config_key}': {e}")
             return False
 
-    def _lemmatize_word(self, word: str) -> str:
-        """Lemmatize a single word by removing common suffixes."""
-        word = word.lower()
-        # Simple lemmatization: remove common suffixes
-        # Order matters - check longer suffixes first
-        suffixes = ['ying', 'ing', 'ied', 'ies', 'ed', 'es', 's']
-        for suffix in suffixes:
-            if word.endswith(suffix) and len(word) > len(suffix) + 2:
-                # Handle doubling: running -> run, stopped -> stop
-                stem = word[:-len(suffix)]
-                if suffix in ('ing', 'ed') and len(stem) >= 2 and stem[-1] == stem[-2]:
-                    stem = stem[:-1]
-                # Handle -ied -> -y: carried -> carry
-                if suffix == 'ied':
-                    stem = stem + 'y'
-                # Handle -ies -> -y: carries -> carry
-                if suffix == 'ies':
-                    stem = stem + 'y'
-                return stem
-        return word
-
-    def _get_base_phrase(self, text: str) -> str:
-        """Extract base phrase from text, lemmatizing each word."""
-        # Remove /IPA/ and (pos.)
-        base = re.sub(r'/[^/]+/', '', text).strip()
-        base = re.sub(r'\([^)]*\)', '', base).strip().lower()
-
-        # Strip punctuation from each word
-        words = [w.strip('.!?,;:…"\'') for w in base.split()]
-        words = [w for w in words if w]  # Remove empty strings
-
-        # Lemmatize each word in the phrase
-        lemmatized = [self._lemmatize_word(w) for w in words]
-        return ' '.join(lemmatized)
-
     def _is_same_word(self, input_text: str, stored_text: str) -> bool:
         """Check if input and stored text refer to the same word/phrase.
 
@@ -452,8 +822,8 @@ class NotionHandler:
         - "blow" does NOT match "land a blow" (different phrase)
         - "landing a blow" matches "land a blow" (same base phrase)
         """
-        input_base = self._get_base_phrase(input_text)
-        stored_base = self._get_base_phrase(stored_text)
+        input_base = _get_base_phrase(input_text)
+        stored_base = _get_base_phrase(stored_text)
 
         # Compare base phrases directly
         # Both single words or both phrases must have same lemmatized form
@@ -471,23 +841,46 @@ class NotionHandler:
 
         return False
 
-    def _find_entry_in_single_db(self, db_id: str, text: str, search_text: str):
+    def _find_entry_in_single_db(self, db_id: str, text: str, search_text: str, search_terms: list):
         """Search a single Notion database for an entry matching the English word/phrase.
 
+        An exact title query comes first. Only if it finds nothing are titles
+        containing every search term read, page by page until one matches,
+        since a common word ("set", "run") can be in hundreds of titles.
+
+        Args:
+            db_id: Database to search
+            text: Word/phrase as entered (verified with _is_same_word)
+            search_text: Word/phrase without annotations, for the exact query
+            search_terms: Title substrings that must all be present
+
         Returns the entry dict or None.
         """
         response = self.client.databases.query(
             database_id=db_id,
-            filter={
-                "property": "English",
-                "title": {
-                    "contains": search_text
-                }
-            },
+            filter={"property": "English", "title": {"equals": search_text}},
             page_size=10
         )
-
-        for page in response["results"]:
+        entry = self._first_same_word(text, response["results"])
+        if entry:
+            return entry
+
+        conditions = [{"property": "English", "title": {"contains": term}} for term in search_terms]
+        query_params = {
+            "database_id": db_id,
+            "filter": conditions[0] if len(conditions) == 1 else {"and": conditions},
+            "page_size": 100,
+        }
+        while True:
+            response = self.client.databases.query(**query_params)
+            entry = self._first_same_word(text, response["results"])
+            if entry or not response.get("has_more"):
+                return entry
+            query_params["start_cursor"] = response["next_cursor"]
+
+    def _first_same_word(self, text: str, pages: list):
+        """Entry dict of the first page whose title is the same word as text, or None."""
+        for page in pages:
             props = page["properties"]
 
             english = ""
@@ -527,17 +920,18 @@ class NotionHandler:
         """
         try:
             # Normalize: strip phonetics/part-of-speech for search
-            search_text = re.sub(r'/[^/]+/', '', text).strip()  # Remove /IPA/
-            search_text = re.sub(r'\([^)]*\)', '', search_text).strip()  # Remove (pos.)
+            search_text = _strip_annotations(text)  # Remove /IPA/ and (pos.)
             search_text = search_text.strip('.!?,;:…"\'')  # Strip trailing punctuation
+            # Search on lemmatized tokens so "landing a blow" finds "land a blow"
+            search_terms = _title_search_tokens(search_text) or [search_text]
 
             if len(self.all_database_ids) == 1:
-                return self._find_entry_in_single_db(self.all_database_ids[0], text, search_text)
+                return self._find_entry_in_single_db(self.all_database_ids[0], text, search_text, search_terms)
 
             # Query all databases in parallel
             with ThreadPoolExecutor(max_workers=len(self.all_database_ids)) as executor:
                 futures = {
-                    executor.submit(self._find_entry_in_single_db, db_id, text, search_text): db_id
+                    executor.submit(self._find_entry_in_single_db, db_id, text, search_text, search_terms): db_id
                     for db_id in self.all_database_ids
                 }
                 for future in as_completed(futures):
@@ -553,23 +947,46 @@ class NotionHandler:
 
         return None
 
-    def _fetch_from_single_db(self, db_id: str, filter_obj: dict, max_pages: int = 5) -> list:
-        """Fetch filtered entries from a single database with pagination."""
+    def _paginate_db(self, db_id: str, filter_obj: dict = None, max_pages: int = None,
+                     max_retries: int = 3, sorts: list = None, page_size: int = 100) -> list:
+        """Fetch all (optionally filtered) pages from a single database.
+
+        Each page request is retried on its own, so a transient error does
+        not restart the whole pagination.
+
+        Args:
+            db_id: Database to query
+            filter_obj: Optional Notion filter object
+            max_pages: Max pagination pages (None = no limit)
+            max_retries: Attempts per page request
+            sorts: Optional Notion sorts list
+            page_size: Results per request (Notion max 100)
+        """
         results = []
         has_more = True
         start_cursor = None
         pages_fetched = 0
 
-        while has_more and pages_fetched < max_pages:
-            query_params = {
-                "database_id": db_id,
-                "page_size": 100,
-                "filter": filter_obj
-            }
+        while has_more and (max_pages is None or pages_fetched < max_pages):
+            query_params = {"database_id": db_id, "page_size": page_size}
+            if filter_obj:
+                query_params["filter"] = filter_obj
+            if sorts:
+                query_params["sorts"] = sorts
             if start_cursor:
                 query_params["start_cursor"] = start_cursor
 
-            response = self.client.databases.query(**query_params)
+            for attempt in range(max_retries):
+                try:
+                    response = self.client.databases.query(**query_params)
+                    break
+                except Exception as e:
+                    if attempt == max_retries - 1:
+                        raise
+                    wait_time = _retry_delay(e, attempt)
+                    logger.warning(f"Query failed for db {db_id[:8]} (attempt {attempt + 1}/{max_retries}): {e}; retrying in {wait_time:.1f}s")
+                    time.sleep(wait_time)
+
             results.extend(response.get("results", []))
             has_more = response.get("has_more", False)
             start_cursor = response.get("next_cursor")
@@ -577,7 +994,24 @@ class NotionHandler:
 
         return results
 
-    def _fetch_filtered_entries(self, filter_obj: dict, max_pages: int = 5) -> list:
+    def _paginate_all_dbs(self, filter_obj: dict = None, max_pages: int = None) -> list:
+        """Fetch pages from every configured database concurrently.
+
+        Wall-clock time is max(db latency) instead of sum(db latency).
+        Raises if any database fails.
+        """
+        if len(self.all_database_ids) == 1:
+            return self._paginate_db(self.all_database_ids[0], filter_obj, max_pages)
+
+        with ThreadPoolExecutor(max_workers=len(self.all_database_ids)) as executor:
+            results = list(executor.map(
+                lambda db_id: self._paginate_db(db_id, filter_obj, max_pages),
+                self.all_database_ids,
+            ))
+        return list(itertools.chain.from_iterable(results))
+
+    def _fetch_filtered_entries(self, filter_obj: dict, max_pages: int = 5,
+                                sorts: list = None, page_size: int = 100) -> list:
         """Fetch entries from all databases with a Notion filter.
 
         Queries all databases in parallel for faster results.
@@ -585,14 +1019,18 @@ class NotionHandler:
         Args:
             filter_obj: Notion filter object
             max_pages: Max pagination pages per database (safety limit)
+            sorts: Optional Notion sorts list
+            page_size: Results per request (Notion max 100)
         """
+        query = partial(self._paginate_db, filter_obj=filter_obj, max_pages=max_pages,
+                        sorts=sorts, page_size=page_size)
         if len(self.all_database_ids) == 1:
-            return self._fetch_from_single_db(self.all_database_ids[0], filter_obj, max_pages)
+            return query(self.all_database_ids[0])
 
         all_results = []
         with ThreadPoolExecutor(max_workers=len(self.all_database_ids)) as executor:
             futures = {
-                executor.submit(self._fetch_from_single_db, db_id, filter_obj, max_pages): db_id
+                executor.submit(query, db_id): db_id
                 for db_id in self.all_database_ids
             }
             for future in as_completed(futures):
@@ -603,37 +1041,197 @@ class NotionHandler:
 
         return all_results
 
+    def _get_all_parsed_entries(self, force: bool = False) -> list:
+        """Return parsed entries from ALL databases, reusing a recent full scan.
+
+        Args:
+            force: Ignore the cached snapshot and rescan every database
+        """
+        key = tuple(self.all_database_ids)
+        if not force:
+            cached = self._cached_entries()
+            if cached is not None:
+                return cached
+
+        entries = self._parse_pages(self._paginate_all_dbs())
+        self._store_snapshot(key, entries=entries)
+        return entries
+
+    def _store_snapshot(self, key: tuple, entries: list = None, pages: list = None) -> None:
+        """Cache a full scan, either parsed (entries) or raw (pages, parsed on first use)."""
+        with self._entries_lock:
+            self._entries_cache = entries
+            self._entries_cache_pages = pages
+            self._entries_index = {e["page_id"]: e for e in entries} if entries else {}
+            self._entries_cache_key = key
+            self._entries_cache_ts = time.monotonic()
+
+    def _snapshot_is_fresh(self) -> bool:
+        """True if a full scan for the current databases is within its TTL."""
+        return ((self._entries_cache is not None or self._entries_cache_pages is not None)
+                and self._entries_cache_key == tuple(self.all_database_ids)
+                and time.monotonic() - self._entries_cache_ts < self._entries_cache_ttl)
+
+    def _cached_entries(self):
+        """Return the cached entry list if still fresh, else None (never fetches)."""
+        with self._entries_lock:
+            if not self._snapshot_is_fresh():
+                return None
+            if self._entries_cache is None:
+                # Scan came from get_review_stats, which only read the review dates
+                self._entries_cache = self._parse_pages(self._entries_cache_pages)
+                self._entries_cache_pages = None
+                self._entries_index = {e["page_id"]: e for e in self._entries_cache}
+            return self._entries_cache
+
+    def _add_cached_entry(self, page_id: str, entry: dict) -> None:
+        """Append a newly saved entry to a fresh snapshot so it stays warm."""
+        self._note_page_meta(page_id, 0, self.database_id)
+        with self._entries_lock:
+            entries = self._cached_entries()
+            if entries is None:
+                return
+            cached = {"page_id": page_id, **_entry_content_fields(entry), "review_count": 0, "mastered": False}
+            if entry.get("date"):
+                cached["date"] = entry["date"]
+            entries.append(cached)
+            self._entries_index[page_id] = cached
+
+    def _update_cached_entry(self, page_id: str, fields: dict) -> None:
+        """Apply a successful write to the matching cached entry, if any.
+
+        The snapshot's timestamp is left alone, so it still expires and
+        picks up changes made outside this handler (e.g. deletions).
+        """
+        with self._entries_lock:
+            if self._cached_entries() is None:
+                return
+            cached = self._entries_index.get(page_id)
+            if cached is not None:
+                cached.update(fields)
+
+    def _recent_candidates(self, today: date, count: int):
+        """Candidate pool of a tiered fetch for at least count words within CANDIDATES_CACHE_TTL, else None."""
+        with self._entries_lock:
+            hit = self._candidates_cache
+            if (hit and hit[1] == today and hit[2] >= count
+                    and time.monotonic() - hit[0] < CANDIDATES_CACHE_TTL):
+                return list(hit[3])
+        return None
+
+    def _store_candidates(self, today: date, count: int, candidates: list) -> None:
+        with self._entries_lock:
+            self._candidates_cache = (time.monotonic(), today, count, candidates)
+
+    def _drop_candidate(self, page_id: str) -> None:
+        """Remove a just-rated page from the reused candidate pool; it is no longer due."""
+        with self._entries_lock:
+            if self._candidates_cache:
+                candidates = self._candidates_cache[3]
+                candidates[:] = [e for e in candidates if e["page_id"] != page_id]
+
+    @staticmethod
+    def _select_candidates(entries: list, today: date, count: int) -> list:
+        """Pick review candidates from already-fetched entries.
+
+        Mirrors the tiered Notion filters in fetch_entries_for_review():
+        due/overdue, new, then legacy and due-within-3-days if still short.
+        """
+        today_str = today.isoformat()
+        soon_str = (today + timedelta(days=3)).isoformat()
+        due, new, legacy, upcoming = [], [], [], []
+
+        for entry in entries:
+            if entry.get("mastered"):
+                continue
+            next_review = (entry.get("next_review") or "")[:10]
+            if next_review:
+                if next_review <= today_str:
+                    due.append(entry)
+                elif next_review <= soon_str:
+                    upcoming.append(entry)
+            elif entry.get("last_reviewed"):
+                legacy.append(entry)
+            else:
+                new.append(entry)
+
+        candidates = due + new
+        if len(candidates) < count:
+            candidates += legacy
+        if len(candidates) < count:
+            candidates += upcoming
+        return candidates
+
     def fetch_random_entries(self, count: int = 10) -> list:
         """Fetch random entries from the database (no smart selection)."""
         return self.fetch_entries_for_review(count, smart=False)
 
-    def fetch_entries_for_review(self, count: int = 10, smart: bool = True, max_retries: int = 3) -> list:
+    def fetch_entries_for_review(self, count: int = 10, smart: bool = True, max_retries: int = 2,
+                                 exclude_ids=()) -> list:
         """
         Fetch entries for review with optional spaced repetition.
         Queries from ALL configured databases (primary + additional).
 
         Uses targeted Notion filters to fetch only review candidates
-        instead of loading the entire database.
+        instead of loading the entire database. If a full scan is still
+        cached (see _get_all_parsed_entries), candidates come from it instead.
+
+        exclude_ids: page ids never to pick in smart mode (e.g. cards just
+        sent and not yet rated, which are still due).
         """
         last_error = None
+        exclude_ids = set(exclude_ids)
+        # Tiers are filled until this many candidates, so excluded ones don't leave the batch short
+        needed = count + len(exclude_ids)
+
+        def _pick(candidates, today):
+            if exclude_ids:
+                candidates = [e for e in candidates if e["page_id"] not in exclude_ids]
+            return self._weighted_pick(candidates, today, count)
 
         for attempt in range(max_retries):
             try:
                 today = date.today()
                 today_str = today.isoformat()
 
+                # A recent full scan (e.g. from get_review_stats) already holds
+                # every entry, so select locally instead of querying again
+                cached = self._cached_entries()
+
+                # Filters need the review properties; without them, scan everything
+                name_map = self._get_prop_name_map()
+                if cached is None and not all(
+                    f in name_map for f in ("next_review", "last_reviewed", "mastered")
+                ):
+                    logger.warning("Review properties not found in schema, using a full scan")
+                    cached = self._get_all_parsed_entries()
+
                 if not smart:
+                    if cached is not None:
+                        parsed = [e for e in cached if not e.get("mastered")]
+                        return random.sample(parsed, min(count, len(parsed)))
                     # Random selection: only fetch non-mastered entries
                     pages = self._fetch_filtered_entries({
-                        "property": "Mastered",
+                        "property": name_map["mastered"],
                         "checkbox": {"equals": False}
                     })
-                    parsed = []
-                    for page in pages:
-                        entry = self._parse_page_to_entry(page)
-                        if entry:
-                            parsed.append(entry)
-                    return random.sample(parsed, min(count, len(parsed)))
+                    return self._reservoir_sample_from_pages(pages, count)
+
+                if cached is not None:
+                    candidates = self._select_candidates(cached, today, needed)
+                    logger.info(f"Candidates from cached entries: {len(candidates)}")
+                    return _pick(candidates, today)
+
+                # A tiered fetch moments ago (e.g. scheduled batch, then /review)
+                # left a candidate pool; re-pick from it instead of querying again
+                recent = self._recent_candidates(today, needed)
+                if recent is not None:
+                    logger.info(f"Reusing {len(recent)} recent candidates")
+                    return _pick(recent, today)
+
+                next_prop = name_map["next_review"]
+                last_prop = name_map["last_reviewed"]
+                not_mastered = {"property": name_map["mastered"], "checkbox": {"equals": False}}
 
                 # Smart selection: fetch only candidates, not everything
                 candidates = []
@@ -646,79 +1244,116 @@ class NotionHandler:
                             seen_ids.add(entry["page_id"])
                             candidates.append(entry)
 
-                # 1. Due/overdue words: Next Review <= today, not mastered
-                due_pages = self._fetch_filtered_entries({
-                    "and": [
-                        {"property": "Next Review", "date": {"on_or_before": today_str}},
-                        {"property": "Mastered", "checkbox": {"equals": False}}
-                    ]
-                })
+                # 1. Due/overdue words: Next Review <= today, not mastered.
+                # Most overdue first, capped at a few times the batch size
+                # (those also score highest in _calculate_review_priority)
+                # 2. New words: never reviewed, not mastered
+                # Both tiers are always needed, so query them at the same time
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    due_future = executor.submit(
+                        self._fetch_filtered_entries,
+                        {
+                            "and": [
+                                {"property": next_prop, "date": {"on_or_before": today_str}},
+                                not_mastered,
+                            ]
+                        },
+                        max_pages=1,
+                        sorts=[{"property": next_prop, "direction": "ascending"}],
+                        page_size=min(max(needed * 3, 1), 100),
+                    )
+                    new_future = executor.submit(self._fetch_filtered_entries, {
+                        "and": [
+                            {"property": last_prop, "date": {"is_empty": True}},
+                            {"property": next_prop, "date": {"is_empty": True}},
+                            not_mastered,
+                        ]
+                    })
+                    due_pages, new_pages = due_future.result(), new_future.result()
+
                 _add_candidates(due_pages)
                 logger.info(f"Due/overdue candidates: {len(candidates)}")
-
-                # 2. New words: never reviewed, not mastered
-                new_pages = self._fetch_filtered_entries({
-                    "and": [
-                        {"property": "Last Reviewed", "date": {"is_empty": True}},
-                        {"property": "Next Review", "date": {"is_empty": True}},
-                        {"property": "Mastered", "checkbox": {"equals": False}}
-                    ]
-                })
                 _add_candidates(new_pages)
                 logger.info(f"Total candidates after new words: {len(candidates)}")
 
                 # 3. Legacy entries (reviewed but no Next Review set)
-                if len(candidates) < count:
+                if len(candidates) < needed:
                     legacy_pages = self._fetch_filtered_entries({
                         "and": [
-                            {"property": "Last Reviewed", "date": {"is_not_empty": True}},
-                            {"property": "Next Review", "date": {"is_empty": True}},
-                            {"property": "Mastered", "checkbox": {"equals": False}}
+                            {"property": last_prop, "date": {"is_not_empty": True}},
+                            {"property": next_prop, "date": {"is_empty": True}},
+                            not_mastered,
                         ]
                     })
                     _add_candidates(legacy_pages)
 
                 # 4. If still not enough, fetch words due within 3 days
-                if len(candidates) < count:
+                if len(candidates) < needed:
                     upcoming_pages = self._fetch_filtered_entries({
                         "and": [
-                            {"property": "Next Review", "date": {"after": today_str}},
-                            {"property": "Next Review", "date": {"on_or_before": (today + timedelta(days=3)).isoformat()}},
-                            {"property": "Mastered", "checkbox": {"equals": False}}
+                            {"property": next_prop, "date": {"after": today_str}},
+                            {"property": next_prop, "date": {"on_or_before": (today + timedelta(days=3)).isoformat()}},
+                            not_mastered,
                         ]
                     })
                     _add_candidates(upcoming_pages)
 
-                if not candidates:
-                    logger.warning("No review candidates found")
-                    return []
-
-                # Weighted random selection from candidates
-                scored = [(self._calculate_review_priority(e, today), e) for e in candidates]
-                weights = [max(s, 1.0) for s, _ in scored]
-                selected = []
-                pool = list(scored)
-
-                for _ in range(min(count, len(pool))):
-                    idx = random.choices(range(len(pool)), weights=weights, k=1)[0]
-                    selected.append(pool[idx][1])
-                    pool.pop(idx)
-                    weights.pop(idx)
-
-                logger.info(f"Selected {len(selected)} entries from {len(candidates)} candidates")
-                return selected
+                self._store_candidates(today, needed, candidates)
+                return _pick(candidates, today)
 
             except Exception as e:
                 last_error = e
                 logger.warning(f"Notion API error on attempt {attempt + 1}/{max_retries}: {e}")
                 if attempt < max_retries - 1:
-                    wait_time = 2 ** (attempt + 1)
-                    logger.info(f"Retrying in {wait_time} seconds...")
+                    wait_time = _retry_delay(e, attempt)
+                    logger.info(f"Retrying in {wait_time:.1f} seconds...")
                     time.sleep(wait_time)
 
         logger.error(f"Failed to fetch entries after {max_retries} attempts. Last error: {last_error}")
         return []
 
+    def _reservoir_sample_from_pages(self, pages, k: int) -> list:
+        """Uniformly sample k entries from pages (Algorithm R), parsing lazily.
+
+        Only pages that enter the reservoir are parsed, so a random batch
+        of 10 from thousands of pages parses a few dozen, not all of them.
+        Unparseable (config) pages that would enter are simply skipped.
+        """
+        reservoir = []
+        for i, page in enumerate(pages):
+            if len(reservoir) < k:
+                entry = self._parse_page_to_entry(page)
+                if entry:
+                    reservoir.append(entry)
+                continue
+            j = random.randint(0, i)
+            if j < k:
+                entry = self._parse_page_to_entry(page)
+                if entry:
+                    reservoir[j] = entry
+        random.shuffle(reservoir)
+        return reservoir
+
+    def _weighted_pick(self, candidates: list, today: date, count: int) -> list:
+        """Weighted random selection (by review priority) without replacement.
+
+        Each candidate gets the key random() ** (1 / weight) and the `count`
+        largest keys win (Efraimidis-Spirakis), which draws the same
+        distribution as repeated weighted picks in one O(N log count) pass.
+        """
+        if not candidates:
+            logger.warning("No review candidates found")
+            return []
+
+        keyed = (
+            (random.random() ** (1.0 / max(self._calculate_review_priority(e, today), 1.0)), i, e)
+            for i, e in enumerate(candidates)
+        )
+        selected = [e for _, _, e in heapq.nlargest(count, keyed)]
+
+        logger.info(f"Selected {len(selected)} entries from {len(candidates)} candidates")
+        return selected
+
     def fetch_unreviewed_from_days_ago(self, days_back: int = 1) -> list:
         """Fetch entries due on each of the last `days_back` days that weren't reviewed today.
 
@@ -771,8 +1406,10 @@ class NotionHandler:
 
         # Factor 1: Next Review date (highest weight)
         if next_review:
-            try:
-                next_date = datetime.strptime(next_review, "%Y-%m-%d").date()
+            next_date = _safe_parse_date(next_review)
+            if next_date is None:
+                score += 50  # If can't parse, moderate priority
+            else:
                 days_until_review = (next_date - today).days
                 if days_until_review <= 0:
                     # Due or overdue: highest priority
@@ -780,8 +1417,6 @@ class NotionHandler:
                 else:
                     # Not yet due: lower priority
                     score += max(0, 30 - days_until_review * 3)
-            except (ValueError, TypeError):
-                score += 50  # If can't parse, moderate priority
         elif not last_reviewed:
             # Never reviewed and no next_review set = new word
             # SAME priority as due words so new words get mixed in with reviews
@@ -789,27 +1424,23 @@ class NotionHandler:
         else:
             # Has been reviewed but no next_review set (legacy entries)
             # Fall back to old algorithm
-            try:
-                last_date = datetime.strptime(last_reviewed, "%Y-%m-%d").date()
-                days_since_review = (today - last_date).days
-                score += min(days_since_review * 2, 50)
-            except (ValueError, TypeError):
+            last_date = _safe_parse_date(last_reviewed)
+            if last_date is None:
                 score += 50
+            else:
+                score += min((today - last_date).days * 2, 50)
 
         # Factor 2: Lower review count = higher score (max 30 points)
         score += max(0, 30 - review_count * 3)
 
         # Factor 3: Newer entries get slight bonus (max 20 points)
-        if date_added:
-            try:
-                added_date = datetime.strptime(date_added, "%Y-%m-%d").date()
-                days_since_added = (today - added_date).days
-                if days_since_added <= 7:
-                    score += 20
-                elif days_since_added <= 30:
-                    score += 10
-            except (ValueError, TypeError):
-                pass
+        added_date = _safe_parse_date(date_added) if date_added else None
+        if added_date:
+            days_since_added = (today - added_date).days
+            if days_since_added <= 7:
+                score += 20
+            elif days_since_added <= 30:
+                score += 10
 
         return score
 
@@ -834,19 +1465,49 @@ class NotionHandler:
         if knew is not None:
             response = "good" if knew else "again"
 
+        return self.update_review_stats_bulk([(page_id, response, current_review_count)])[0]
+
+    def update_review_stats_bulk(self, updates: list) -> list:
+        """Apply several review ratings concurrently.
+
+        Notion has no bulk update endpoint, so each card is still one
+        pages.update, but up to REVIEW_UPDATE_WORKERS run at once.
+
+        Args:
+            updates: (page_id, response) or (page_id, response, current_review_count)
+                tuples; see update_review_stats()
+
+        Returns:
+            List of result dicts, in the same order as updates
+        """
+        if len(updates) <= 1:
+            return [self._apply_review_update(*u) for u in updates]
+
+        with ThreadPoolExecutor(max_workers=min(REVIEW_UPDATE_WORKERS, len(updates))) as executor:
+            return list(executor.map(lambda u: self._apply_review_update(*u), updates))
+
+    def _apply_review_update(self, page_id: str, response: str = "good", current_review_count: int = None) -> dict:
+        """Schedule the next review of one card and write it to Notion."""
         try:
+            meta = self._recent_page_meta(page_id)
+            db_id = meta[1] if meta else None
+            if current_review_count is None and meta:
+                # Count seen by a fetch within PAGE_META_TTL
+                current_review_count = meta[0]
+
             if current_review_count is not None:
                 # Fast path: use cached review count, skip pages.retrieve
                 current_count = current_review_count
+                # Property names of the page's own database (primary if unknown)
+                name_map = self._get_prop_name_map(db_id)
             else:
-                # Fallback: fetch from Notion (legacy callers)
+                # Fallback: fetch from Notion (legacy callers, stale counts)
                 page = self.client.pages.retrieve(page_id=page_id)
-                properties = page.get("properties", {})
-                current_count = 0
-                for prop_name, prop_value in properties.items():
-                    if prop_value.get("type") == "number" and "review" in prop_name.lower() and "count" in prop_name.lower():
-                        current_count = prop_value.get("number") or 0
-                        break
+                db_id = (page.get("parent") or {}).get("database_id")
+                name_map = self._get_prop_name_map(db_id)
+                count_value = page.get("properties", {}).get(name_map.get("review_count", "Review Count"), {})
+                current_count = count_value.get("number") or 0
+            count_prop = name_map.get("review_count", "Review Count")
 
             # Calculate next review date and new count based on response
             today = date.today()
@@ -869,76 +1530,75 @@ class NotionHandler:
             # Check if word has reached mastery
             mastered = new_count >= MASTERY_THRESHOLD and response != "again"
 
-            # Update with known property names (consistent across all vocab databases)
+            # Property names resolved from the cached schema; fall back to the
+            # standard names
             update_props = {
-                "Last Reviewed": {"date": {"start": today.isoformat()}},
-                "Next Review": {"date": {"start": next_review.isoformat()}},
-                "Review Count": {"number": new_count},
+                name_map.get("last_reviewed", "Last Reviewed"): {"date": {"start": today.isoformat()}},
+                name_map.get("next_review", "Next Review"): {"date": {"start": next_review.isoformat()}},
+                count_prop: {"number": new_count},
             }
             if mastered:
-                update_props["Mastered"] = {"checkbox": True}
+                update_props[name_map.get("mastered", "Mastered")] = {"checkbox": True}
 
             self.client.pages.update(page_id=page_id, properties=update_props)
+            self._note_page_meta(page_id, new_count, db_id)
+            review_fields = {
+                "last_reviewed": today.isoformat(),
+                "next_review": next_review.isoformat(),
+                "review_count": new_count,
+            }
+            if mastered:
+                review_fields["mastered"] = True
+            self._update_cached_entry(page_id, review_fields)
+            self._drop_candidate(page_id)
 
             return {"success": True, "next_review": next_review.isoformat(), "mastered": mastered}
 
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def get_review_stats(self, max_retries: int = 3) -> dict:
+    def get_review_stats(self, max_retries: int = 2) -> dict:
         """Get statistics about pending reviews from ALL configured databases."""
         last_error = None
 
         for attempt in range(max_retries):
             try:
-                # Query all entries from ALL databases
-                all_entries = []
-
-                for db_id in self.all_database_ids:
-                    has_more = True
-                    start_cursor = None
-
-                    while has_more:
-                        query_params = {"database_id": db_id, "page_size": 100}
-                        if start_cursor:
-                            query_params["start_cursor"] = start_cursor
-
-                        response = self.client.databases.query(**query_params)
-                        all_entries.extend(response.get("results", []))
-                        has_more = response.get("has_more", False)
-                        start_cursor = response.get("next_cursor")
+                # All entries from ALL databases (cached for ENTRIES_CACHE_TTL).
+                # Only three fields are needed, so raw pages are not fully parsed
+                fresh = self._snapshot_is_fresh()
+                entries, pages = self._entries_cache, self._entries_cache_pages
+                if fresh and entries is not None:
+                    rows = [
+                        (e.get("next_review"), e.get("last_reviewed"), e.get("mastered", False))
+                        for e in entries
+                    ]
+                else:
+                    if not fresh or pages is None:
+                        pages = self._paginate_all_dbs()
+                        self._store_snapshot(tuple(self.all_database_ids), pages=pages)
+                    rows = [r for r in map(self._quick_review_fields, pages) if r]
 
                 today = date.today()
                 overdue = 0
                 due_today = 0
                 new_words = 0
                 mastered = 0
-                total = len(all_entries)
-
-                for page in all_entries:
-                    entry = self._parse_page_to_entry(page)
-                    if not entry:
-                        continue
+                total = len(rows)
 
-                    if entry.get("mastered", False):
+                for next_review, last_reviewed, is_mastered in rows:
+                    if is_mastered:
                         mastered += 1
                         continue
 
-                    next_review = entry.get("next_review")
-                    last_reviewed = entry.get("last_reviewed")
-
                     if not last_reviewed and not next_review:
                         # Never reviewed
                         new_words += 1
                     elif next_review:
-                        try:
-                            next_date = datetime.strptime(next_review, "%Y-%m-%d").date()
-                            if next_date < today:
-                                overdue += 1
-                            elif next_date == today:
-                                due_today += 1
-                        except (ValueError, TypeError):
-                            pass
+                        next_date = _safe_parse_date(next_review)
+                        if next_date is not None and next_date < today:
+                            overdue += 1
+                        elif next_date == today:
+                            due_today += 1
 
                 return {
                     "overdue": overdue,
@@ -952,8 +1612,7 @@ class NotionHandler:
                 last_error = e
                 logger.warning(f"Notion API error getting stats on attempt {attempt + 1}/{max_retries}: {e}")
                 if attempt < max_retries - 1:
-                    wait_time = 2 ** (attempt + 1)
-                    time.sleep(wait_time)
+                    time.sleep(_retry_delay(e, attempt))
 
         logger.error(f"Failed to get review stats after {max_retries} attempts. Last error: {last_error}")
         return {"error": str(last_error)}
@@ -1015,76 +1674,75 @@ class NotionHandler:
                 last_error = e
                 logger.warning(f"Notion API error getting words reviewed on attempt {attempt + 1}/{max_retries}: {e}")
                 if attempt < max_retries - 1:
-                    wait_time = 2 ** (attempt + 1)
-                    time.sleep(wait_time)
+                    time.sleep(_retry_delay(e, attempt))
 
         logger.error(f"Failed to get words reviewed after {max_retries} attempts. Last error: {last_error}")
         return {"count": 0, "error": str(last_error)}
 
-    def _parse_page_to_entry(self, page: dict) -> dict:
-        """Parse a Notion page into an entry dictionary."""
-        try:
-            properties = page.get("properties", {})
-            entry = {
-                "page_id": page.get("id")  # Store page ID for updates
-            }
-
-            for prop_name, prop_value in properties.items():
-                prop_type = prop_value.get("type")
-                prop_name_lower = prop_name.lower()
-
-                # Title property (English word)
-                if prop_type == "title":
-                    title_content = prop_value.get("title", [])
-                    if title_content:
-                        title_text = title_content[0].get("plain_text", "")
-                        # Skip config pages (used for bot settings persistence)
-                        if title_text.startswith("__CONFIG_"):
-                            return None
-                        entry["english"] = title_text
-
-                # Rich text properties
-                elif prop_type == "rich_text":
-                    rich_text = prop_value.get("rich_text", [])
-                    content = rich_text[0].get("plain_text", "") if rich_text else ""
-
-                    if "chinese" in prop_name_lower or "中文" in prop_name_lower:
-                        entry["chinese"] = content
-                    elif "explanation" in prop_name_lower or "解释" in prop_name_lower:
-                        entry["explanation"] = content
-                    elif "example" in prop_name_lower or "例句" in prop_name_lower:
-                        entry["example"] = content
+    def _quick_review_fields(self, page: dict):
+        """(next_review, last_reviewed, mastered) read straight from a page.
 
-                # Select property (category)
-                elif prop_type == "select":
-                    if "category" in prop_name_lower or "类别" in prop_name_lower:
-                        select_value = prop_value.get("select")
-                        if select_value:
-                            entry["category"] = select_value.get("name", "")
+        Looks up only the resolved review properties instead of parsing the
+        whole page. Returns None for pages the full parser would drop
+        (config pages, untitled pages).
+        """
+        props = page.get("properties", {})
+        db_id = (page.get("parent") or {}).get("database_id")
+        names = self._review_prop_names.get(db_id)
+        if names is None:
+            resolver = self._page_resolvers.setdefault(db_id, {})
+            names = {}
+            for prop_name, prop_value in props.items():
+                if prop_name not in resolver:
+                    resolver[prop_name] = _resolve_page_property(prop_name, prop_value.get("type"))
+                if resolver[prop_name]:
+                    names[resolver[prop_name]] = prop_name
+            self._review_prop_names[db_id] = names
+
+        title = props.get(names.get("english"), {}).get("title") or []
+        title_text = title[0].get("plain_text", "") if title else ""
+        if not title_text or title_text.startswith("__CONFIG_"):
+            return None
 
-                # Date properties
-                elif prop_type == "date":
-                    date_value = prop_value.get("date")
-                    if date_value:
-                        date_start = date_value.get("start", "")
-                        if "next" in prop_name_lower and "review" in prop_name_lower:
-                            entry["next_review"] = date_start
-                        elif "last" in prop_name_lower and "review" in prop_name_lower:
-                            entry["last_reviewed"] = date_start
-                        elif prop_name_lower == "date" or "added" in prop_name_lower:
-                            entry["date"] = date_start
-
-                # Number properties
-                elif prop_type == "number":
-                    if "review" in prop_name_lower and "count" in prop_name_lower:
-                        entry["review_count"] = prop_value.get("number") or 0
-
-                # Checkbox properties
-                elif prop_type == "checkbox":
-                    if "master" in prop_name_lower:
-                        entry["mastered"] = prop_value.get("checkbox", False)
-
-            return entry if entry.get("english") else None
+        next_value = props.get(names.get("next_review"), {}).get("date")
+        last_value = props.get(names.get("last_reviewed"), {}).get("date")
+        return (
+            next_value.get("start", "") if next_value else None,
+            last_value.get("start", "") if last_value else None,
+            props.get(names.get("mastered"), {}).get("checkbox", False),
+        )
 
-        except Exception:
-            return None
+    def _parse_page_to_entry(self, page: dict) -> dict:
+        """Parse a Notion page into an entry dictionary."""
+        entry = _parse_page_to_entry_static(page, self._page_resolvers)
+        if entry:
+            self._remember_page(page, entry)
+        return entry
+
+    def _remember_page(self, page: dict, entry: dict) -> None:
+        """Record what update_review_stats needs later: review count and database."""
+        self._note_page_meta(entry["page_id"], entry.get("review_count", 0),
+                             (page.get("parent") or {}).get("database_id"))
+
+    def _note_page_meta(self, page_id: str, review_count: int, db_id: str) -> None:
+        with self._entries_lock:
+            self._page_meta[page_id] = (time.monotonic(), review_count, db_id)
+            self._page_meta.move_to_end(page_id)
+            while len(self._page_meta) > PAGE_META_MAX:
+                self._page_meta.popitem(last=False)
+
+    def _recent_page_meta(self, page_id: str):
+        """(review count, database id) seen within PAGE_META_TTL, else None.
+
+        Older counts may have been changed in Notion or by another bot
+        process, so callers re-read the page instead.
+        """
+        with self._entries_lock:
+            meta = self._page_meta.get(page_id)
+            if meta is None or time.monotonic() - meta[0] >= PAGE_META_TTL:
+                return None
+            return meta[1], meta[2]
+
+    def _parse_pages(self, pages: list) -> list:
+        """Parse pages into entries, dropping config/invalid pages."""
+        return [e for e in map(self._parse_page_to_entry, pages) if e]
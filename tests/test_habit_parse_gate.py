@@ -0,0 +1,40 @@
+"""Tests for the habit bot's regex-first task parse gate"""
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+@pytest.mark.parametrize("text", [
+    "明天3点开会",
+    "明天3点半开会",
+    "明天两点开会",
+    "明天下午3点半开会",
+    "明天在下午3点开会",
+    "meeting tomorrow 3:30",
+    "tomorrow 9am class in room 12:00",
+    "tomorrow at 7:30pm dinner",
+    "明天下午3点到5点开会",
+])
+def test_ambiguous_inputs_go_to_the_ai(text):
+    from habit import habit_bot
+    from habit.task_parser import TaskParser
+    assert not habit_bot._regex_parse_is_confident(text, TaskParser().parse(text))
+
+
+@pytest.mark.parametrize("text, task, start", [
+    ("明天下午3点开会", "开会", "15:00"),
+    ("明天下午三点开会", "开会", "15:00"),
+    ("明天3pm开会", "开会", "15:00"),
+    ("tomorrow 3pm gym", "gym", "15:00"),
+    ("dinner with Justin tomorrow at 7pm", "dinner with Justin", "19:00"),
+])
+def test_marked_hours_skip_the_ai(text, task, start):
+    from habit import habit_bot
+    client = MagicMock()
+    with patch.object(habit_bot, "ai_client", client):
+        parsed = asyncio.run(habit_bot.parse_task_with_ai(text))
+    client.messages.create.assert_not_called()
+    assert parsed["task"] == task
+    assert parsed["start_time"] == start
+    assert parsed["end_time"] is None
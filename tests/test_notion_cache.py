@@ -0,0 +1,109 @@
+"""Tests for NotionHandler's entry snapshot and tiered review pick"""
+from datetime import date, timedelta
+from unittest.mock import MagicMock, patch
+
+
+TODAY = date(2026, 3, 10)
+
+
+def _make_handler(db_ids=("db1",)):
+    from shared.notion_handler import NotionHandler
+    with patch("shared.notion_handler.Client"):
+        handler = NotionHandler("key", db_ids[0], list(db_ids[1:]))
+    handler.client = MagicMock()
+    return handler
+
+
+def _entry(page_id, **fields):
+    return {"page_id": page_id, "english": page_id, "review_count": 0, "mastered": False, **fields}
+
+
+def _with_snapshot(handler, entries):
+    handler._store_snapshot(tuple(handler.all_database_ids), entries=entries)
+    return handler
+
+
+def test_expired_snapshot_is_not_served():
+    handler = _with_snapshot(_make_handler(), [_entry("p1")])
+    handler._entries_cache_ts -= handler._entries_cache_ttl + 1
+    assert handler._cached_entries() is None
+
+
+def test_snapshot_is_dropped_when_databases_change():
+    handler = _with_snapshot(_make_handler(), [_entry("p1")])
+    handler.all_database_ids = ["db1", "db2"]
+    assert handler._cached_entries() is None
+
+
+def test_select_candidates_due_and_new_first():
+    from shared.notion_handler import NotionHandler
+    due = _entry("due", next_review=(TODAY - timedelta(days=1)).isoformat(), last_reviewed="2026-03-01")
+    new = _entry("new")
+    legacy = _entry("legacy", last_reviewed="2026-03-01")
+    upcoming = _entry("soon", next_review=(TODAY + timedelta(days=2)).isoformat(), last_reviewed="2026-03-01")
+    later = _entry("later", next_review=(TODAY + timedelta(days=10)).isoformat(), last_reviewed="2026-03-01")
+    mastered = _entry("mastered", mastered=True)
+    entries = [later, upcoming, legacy, new, due, mastered]
+
+    picked = NotionHandler._select_candidates(entries, TODAY, 2)
+    assert [e["page_id"] for e in picked] == ["due", "new"]
+
+
+def test_select_candidates_tops_up_from_legacy_then_upcoming():
+    from shared.notion_handler import NotionHandler
+    due = _entry("due", next_review=TODAY.isoformat(), last_reviewed="2026-03-01")
+    legacy = _entry("legacy", last_reviewed="2026-03-01")
+    upcoming = _entry("soon", next_review=(TODAY + timedelta(days=3)).isoformat(), last_reviewed="2026-03-01")
+    entries = [upcoming, legacy, due]
+
+    assert [e["page_id"] for e in NotionHandler._select_candidates(entries, TODAY, 2)] == ["due", "legacy"]
+    assert [e["page_id"] for e in NotionHandler._select_candidates(entries, TODAY, 3)] == ["due", "legacy", "soon"]
+
+
+def test_weighted_pick_returns_count_distinct_entries():
+    handler = _make_handler()
+    candidates = [_entry(f"p{i}") for i in range(20)]
+    picked = handler._weighted_pick(candidates, TODAY, 5)
+    assert len(picked) == 5
+    assert len({e["page_id"] for e in picked}) == 5
+
+
+def test_save_appends_to_fresh_snapshot():
+    handler = _with_snapshot(_make_handler(), [_entry("p1")])
+    handler.client.pages.create.return_value = {"id": "p2", "url": ""}
+    result = handler.save_entry({"english": "new word", "chinese": "新词", "category": "其他"})
+    assert result["success"]
+    cached = handler._cached_entries()
+    assert [e["page_id"] for e in cached] == ["p1", "p2"]
+    assert cached[1]["english"] == "new word"
+    assert cached[1]["review_count"] == 0
+
+
+def test_update_changes_cached_entry_in_place():
+    handler = _with_snapshot(_make_handler(), [_entry("p1", chinese="旧")])
+    handler.client.pages.update.return_value = {"id": "p1"}
+    result = handler.update_entry_content("p1", {"english": "p1", "chinese": "新"})
+    assert result["success"]
+    assert handler._cached_entries()[0]["chinese"] == "新"
+
+
+def test_failed_save_leaves_snapshot_alone():
+    handler = _with_snapshot(_make_handler(), [_entry("p1")])
+    handler.client.pages.create.side_effect = Exception("Notion 500")
+    result = handler.save_entry({"english": "new word"})
+    assert not result["success"]
+    assert [e["page_id"] for e in handler._cached_entries()] == ["p1"]
+
+
+def test_expired_snapshot_is_not_updated():
+    handler = _with_snapshot(_make_handler(), [_entry("p1", chinese="旧")])
+    handler._entries_cache_ts -= handler._entries_cache_ttl + 1
+    handler._update_cached_entry("p1", {"chinese": "新"})
+    assert handler._entries_cache[0]["chinese"] == "旧"
+
+
+def test_fetch_for_review_uses_snapshot_and_skips_excluded():
+    handler = _with_snapshot(_make_handler(), [_entry("p1"), _entry("p2"), _entry("p3")])
+    picked = handler.fetch_entries_for_review(3, exclude_ids=["p2"])
+    assert sorted(e["page_id"] for e in picked) == ["p1", "p3"]
+    handler.client.databases.query.assert_not_called()
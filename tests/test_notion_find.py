@@ -0,0 +1,60 @@
+"""Tests for NotionHandler.find_entry_by_english() duplicate lookup"""
+from unittest.mock import MagicMock, patch
+
+
+def _make_handler(db_ids):
+    from shared.notion_handler import NotionHandler
+    with patch("shared.notion_handler.Client"):
+        handler = NotionHandler("key", db_ids[0], list(db_ids[1:]))
+    handler.client = MagicMock()
+    return handler
+
+
+def _make_page(title, page_id=None):
+    return {
+        "id": page_id or title,
+        "properties": {
+            "English": {
+                "type": "title",
+                "title": [{"plain_text": title}]
+            }
+        }
+    }
+
+
+def test_exact_title_query_comes_first():
+    handler = _make_handler(["db1"])
+    handler.client.databases.query.return_value = {"results": [_make_page("set")], "has_more": False}
+    entry = handler.find_entry_by_english("set")
+    assert entry["page_id"] == "set"
+    handler.client.databases.query.assert_called_once()
+    assert handler.client.databases.query.call_args.kwargs["filter"] == {
+        "property": "English", "title": {"equals": "set"}
+    }
+
+
+def test_token_search_pages_until_a_match():
+    """A common word matches many titles; the real one may be on a later page."""
+    handler = _make_handler(["db1"])
+    calls = []
+    def query_side_effect(**kwargs):
+        calls.append(kwargs)
+        if "equals" in kwargs["filter"]["title"]:
+            return {"results": [], "has_more": False}
+        if not kwargs.get("start_cursor"):
+            return {
+                "results": [_make_page(f"set {i} up") for i in range(100)],
+                "has_more": True,
+                "next_cursor": "cursor2",
+            }
+        return {"results": [_make_page("sets", "p-sets")], "has_more": False}
+    handler.client.databases.query.side_effect = query_side_effect
+    entry = handler.find_entry_by_english("set")
+    assert entry["page_id"] == "p-sets"
+    assert len(calls) == 3
+
+
+def test_no_match_returns_none():
+    handler = _make_handler(["db1"])
+    handler.client.databases.query.return_value = {"results": [_make_page("land a blow")], "has_more": False}
+    assert handler.find_entry_by_english("blow") is None
@@ -0,0 +1,70 @@
+"""Tests for Notion retry delays and request pacing"""
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+
+class _ApiError(Exception):
+    def __init__(self, status, headers=None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.headers = headers
+
+
+def test_parse_retry_after_seconds():
+    from shared.notion_handler import _parse_retry_after
+    assert _parse_retry_after("7") == 7.0
+    assert _parse_retry_after("0.5") == 0.5
+    assert _parse_retry_after("-3") == 0.0
+
+
+def test_parse_retry_after_http_date():
+    from shared.notion_handler import _parse_retry_after
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    delay = _parse_retry_after(format_datetime(retry_at, usegmt=True))
+    assert 28 <= delay <= 30
+
+
+def test_parse_retry_after_missing_or_invalid():
+    from shared.notion_handler import _parse_retry_after
+    assert _parse_retry_after(None) is None
+    assert _parse_retry_after("") is None
+    assert _parse_retry_after("soon") is None
+
+
+def test_retry_delay_honors_retry_after_on_429():
+    from shared.notion_handler import _retry_delay
+    delay = _retry_delay(_ApiError(429, {"retry-after": "12"}), attempt=0)
+    assert 12 <= delay <= 12.5
+
+
+def test_retry_delay_backs_off_exponentially():
+    from shared.notion_handler import _retry_delay
+    assert 2 <= _retry_delay(_ApiError(500), attempt=0) <= 3
+    assert 8 <= _retry_delay(_ApiError(500), attempt=2) <= 9
+    # 429 without Retry-After falls back to backoff too
+    assert 4 <= _retry_delay(_ApiError(429, {}), attempt=1) <= 5
+
+
+def test_retry_delay_caps_at_60_seconds():
+    from shared.notion_handler import _retry_delay
+    assert 60 <= _retry_delay(Exception("timeout"), attempt=10) <= 61
+
+
+def test_token_bucket_allows_burst_up_to_capacity():
+    from shared.notion_handler import _TokenBucket
+    bucket = _TokenBucket(rate=3.0, capacity=3.0)
+    with patch("shared.notion_handler.time.sleep") as sleep:
+        for _ in range(3):
+            bucket.acquire()
+    sleep.assert_not_called()
+
+
+def test_token_bucket_waits_once_empty():
+    from shared.notion_handler import _TokenBucket
+    bucket = _TokenBucket(rate=10.0, capacity=1.0)
+    bucket.acquire()
+    start = time.monotonic()
+    bucket.acquire()
+    assert time.monotonic() - start >= 0.08
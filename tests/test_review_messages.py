@@ -0,0 +1,67 @@
+"""Tests for review_bot schedule parsing and grouped review messages"""
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.mark.parametrize("text", [
+    "20 words at 8 13 17 19 22",
+    "5 word at 9",
+    "10 Words AT 7 7 21",
+    "99 words at 8 12",
+    "20 words at 8 25",
+])
+def test_fast_schedule_parse_matches_regex_parse(text):
+    from review import review_bot
+    fast = review_bot._fast_parse_schedule(text)
+    assert fast is not None
+    with patch.object(review_bot, "_fast_parse_schedule", return_value=None):
+        assert review_bot.parse_schedule_text(text) == fast
+
+
+@pytest.mark.parametrize("text", ["at 8 13", "20 words at eight", "20 words 8 13", "20 words at ８"])
+def test_fast_schedule_parse_defers_other_forms(text):
+    from review import review_bot
+    assert review_bot._fast_parse_schedule(text) is None
+
+
+def _entries(n, explanation="x"):
+    return [{"page_id": f"p{i}", "english": f"word{i}", "chinese": "词", "explanation": explanation}
+            for i in range(n)]
+
+
+def test_one_card_per_message_by_default():
+    from review import review_bot
+    with patch.object(review_bot, "REVIEW_GROUP_SIZE", 1):
+        messages = review_bot.build_review_messages(_entries(3), 3)
+    assert len(messages) == 3
+    assert all(len(markup.inline_keyboard) == 1 for _, markup in messages)
+
+
+def test_grouped_messages_respect_group_size():
+    from review import review_bot
+    with patch.object(review_bot, "REVIEW_GROUP_SIZE", 3):
+        messages = review_bot.build_review_messages(_entries(7), 7)
+    assert [len(markup.inline_keyboard) for _, markup in messages] == [3, 3, 1]
+    # Rows are numbered and point at their own card
+    first_row = messages[1][1].inline_keyboard[0]
+    assert first_row[0].text.endswith(" 4")
+    assert first_row[0].callback_data == "again_p3"
+
+
+def test_grouped_messages_stay_under_char_cap():
+    from review import review_bot
+    entries = _entries(12, explanation="long explanation " * 60)
+    with patch.object(review_bot, "REVIEW_GROUP_SIZE", 0):
+        messages = review_bot.build_review_messages(entries, 12)
+    assert len(messages) > 1
+    assert all(len(text) <= review_bot.GROUP_MAX_CHARS for text, _ in messages)
+    assert sum(len(markup.inline_keyboard) for _, markup in messages) == 12
+
+
+def test_grouped_messages_cap_cards_per_message():
+    from review import review_bot
+    with patch.object(review_bot, "REVIEW_GROUP_SIZE", 0):
+        messages = review_bot.build_review_messages(_entries(40, explanation=""), 40)
+    assert all(len(markup.inline_keyboard) <= review_bot.GROUP_MAX_CARDS for _, markup in messages)
+    assert sum(len(markup.inline_keyboard) for _, markup in messages) == 40
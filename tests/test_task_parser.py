@@ -0,0 +1,42 @@
+"""Tests for the regex TaskParser's time extraction"""
+from datetime import datetime, timedelta
+
+import pytest
+
+
+@pytest.fixture
+def parser():
+    from habit.task_parser import TaskParser
+    return TaskParser()
+
+
+def test_chinese_range_removes_both_times(parser):
+    result = parser.parse("下午3点到5点 开会")
+    assert result["start_time"] == "15:00"
+    assert "点" not in result["task"]
+    assert "5" not in result["task"]
+    assert result["task"].endswith("开会")
+
+
+def test_english_time_after_chinese_date(parser):
+    result = parser.parse("明天3pm开会")
+    tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+    assert result["date"] == tomorrow
+    assert result["start_time"] == "15:00"
+    assert result["task"] == "开会"
+
+
+def test_bare_number_is_not_a_time(parser):
+    result = parser.parse("buy 2 apples")
+    assert result["start_time"] is None
+    assert result["task"] == "buy 2 apples"
+
+
+@pytest.mark.parametrize("text, start", [
+    ("meeting at 3pm", "15:00"),
+    ("call mom 14:30", "14:30"),
+    ("standup 9:15 am", "09:15"),
+    ("lunch 12am", "00:00"),
+])
+def test_english_times(parser, text, start):
+    assert parser.parse(text)["start_time"] == start
@@ -1049,20 +1049,24 @@ async def handle_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         replaced_entries = []
         failed_count = 0
 
+        new_entries = []
         for idx in indices:
             entry = pending_entries[idx - 1]
             page_id = dup_page_ids.get(idx - 1)  # 0-indexed
 
             if page_id:
                 result = notion_handler.update_entry_content(page_id, entry)
+                if result["success"]:
+                    replaced_entries.append(entry)
+                else:
+                    failed_count += 1
             else:
-                result = notion_handler.save_entry(entry)
+                new_entries.append(entry)
 
+        # New words are independent pages.create calls, so save them concurrently
+        for entry, result in zip(new_entries, await notion_handler.save_entries(new_entries)):
             if result["success"]:
-                if page_id:
-                    replaced_entries.append(entry)
-                else:
-                    saved_entries.append(entry)
+                saved_entries.append(entry)
             else:
                 failed_count += 1
 